@@ -2,95 +2,40 @@
 Generate comprehensive PDF report for AI Pathfinder assignment
 """
 
-from reportlab.lib.pagesizes import letter, A4
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_JUSTIFY
-from reportlab.platypus import (SimpleDocTemplate, Paragraph, Spacer, PageBreak,
-                                Table, TableStyle, Image, KeepTogether)
-from reportlab.lib import colors
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 import os
 
 
+OUTPUT_DIR = '/mnt/user-data/outputs'
+
+_MONTHS = ('January', 'February', 'March', 'April', 'May', 'June', 'July',
+           'August', 'September', 'October', 'November', 'December')
+
+
+@lru_cache(maxsize=1)
+def _ensure_output_dir():
+    """Create the output directory (only checked once per process)"""
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+
+
+def _format_date(dt):
+    """Format a date like 'March 05, 2026' without going through strftime"""
+    return f"{_MONTHS[dt.month - 1]} {dt.day:02d}, {dt.year}"
+
+
 def create_report(student_id="24F-0744", student_name="Zobia Razzaq"):
     """Create comprehensive assignment report"""
+    # ReportLab is only imported once a report is actually requested
+    from report_layout import render_report
     
-    # Create output directory if it doesn't exist
-    os.makedirs('/mnt/user-data/outputs', exist_ok=True)
-    
-    # Create PDF document
-    pdf_path = f'/mnt/user-data/outputs/AI2002_Assignment1_Report_{student_id}.pdf'
-    doc = SimpleDocTemplate(pdf_path, pagesize=letter,
-                           rightMargin=72, leftMargin=72,
-                           topMargin=72, bottomMargin=18)
-    
-    # Container for 'Flowable' objects
-    elements = []
-    
-    # Define styles
-    styles = getSampleStyleSheet()
-    
-    # Custom styles
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=24,
-        textColor=colors.HexColor('#1a1a1a'),
-        spaceAfter=30,
-        alignment=TA_CENTER,
-        fontName='Helvetica-Bold'
-    )
-    
-    heading1_style = ParagraphStyle(
-        'CustomHeading1',
-        parent=styles['Heading1'],
-        fontSize=18,
-        textColor=colors.HexColor('#2c3e50'),
-        spaceAfter=12,
-        spaceBefore=12,
-        fontName='Helvetica-Bold'
-    )
-    
-    heading2_style = ParagraphStyle(
-        'CustomHeading2',
-        parent=styles['Heading2'],
-        fontSize=14,
-        textColor=colors.HexColor('#34495e'),
-        spaceAfter=10,
-        spaceBefore=10,
-        fontName='Helvetica-Bold'
-    )
-    
-    body_style = ParagraphStyle(
-        'CustomBody',
-        parent=styles['BodyText'],
-        fontSize=11,
-        alignment=TA_JUSTIFY,
-        spaceAfter=12,
-        leading=14
-    )
+    submission_date = _format_date(datetime.now())
     
-    code_style = ParagraphStyle(
-        'CodeStyle',
-        parent=styles['Code'],
-        fontSize=9,
-        fontName='Courier',
-        leftIndent=20,
-        spaceAfter=10
-    )
-    
-    # ==================== Cover Page ====================
-    elements.append(Spacer(1, 1.5*inch))
-    
-    elements.append(Paragraph("AI 2002 - Artificial Intelligence", title_style))
-    elements.append(Spacer(1, 0.3*inch))
-    
-    elements.append(Paragraph("Assignment 1: Question 7", heading1_style))
-    elements.append(Spacer(1, 0.2*inch))
+    # Create output directory if it doesn't exist
+    _ensure_output_dir()
     
-    elements.append(Paragraph("Uninformed Search in a Grid Environment", heading2_style))
-    elements.append(Spacer(1, 0.5*inch))
+    pdf_path = f'{OUTPUT_DIR}/AI2002_Assignment1_Report_{student_id}.pdf'
     
     # Student information
     info_data = [
@@ -98,600 +43,44 @@ def create_report(student_id="24F-0744", student_name="Zobia Razzaq"):
         ["Student ID:", student_id],
         ["Course:", "AI 2002 - Artificial Intelligence"],
         ["Semester:", "Spring 2026"],
-        ["Submission Date:", datetime.now().strftime("%B %d, %Y")]
-    ]
-    
-    info_table = Table(info_data, colWidths=[2*inch, 3*inch])
-    info_table.setStyle(TableStyle([
-        ('FONT', (0, 0), (-1, -1), 'Helvetica', 11),
-        ('FONT', (0, 0), (0, -1), 'Helvetica-Bold', 11),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('LINEBELOW', (0, -1), (-1, -1), 1, colors.grey),
-        ('ROWBACKGROUNDS', (0, 0), (-1, -1), [colors.white, colors.lightgrey])
-    ]))
-    
-    elements.append(info_table)
-    elements.append(PageBreak())
-    
-    # ==================== Table of Contents ====================
-    elements.append(Paragraph("Table of Contents", heading1_style))
-    elements.append(Spacer(1, 0.2*inch))
-    
-    toc_items = [
-        "1. Executive Summary",
-        "2. Project Overview",
-        "3. Algorithm Implementations",
-        "   3.1 Breadth-First Search (BFS)",
-        "   3.2 Depth-First Search (DFS)",
-        "   3.3 Uniform-Cost Search (UCS)",
-        "   3.4 Depth-Limited Search (DLS)",
-        "   3.5 Iterative Deepening DFS (IDDFS)",
-        "   3.6 Bidirectional Search",
-        "4. Dynamic Obstacle System",
-        "5. Visualization Implementation",
-        "6. Performance Analysis",
-        "7. Test Cases and Results",
-        "8. Challenges and Solutions",
-        "9. Conclusion",
-        "10. References"
-    ]
-    
-    for item in toc_items:
-        elements.append(Paragraph(item, body_style))
-    
-    elements.append(PageBreak())
-    
-    # ==================== Executive Summary ====================
-    elements.append(Paragraph("1. Executive Summary", heading1_style))
-    elements.append(Spacer(1, 0.1*inch))
-    
-    summary_text = """
-    This report presents a comprehensive implementation of six uninformed search algorithms 
-    applied to pathfinding in a dynamic grid environment. The project successfully demonstrates 
-    how different search strategies explore a graph space, with real-time visualization showing 
-    the exploration process, frontier management, and final path selection.
-    
-    All six algorithms (BFS, DFS, UCS, DLS, IDDFS, and Bidirectional Search) have been 
-    implemented with support for 8-directional movement (including all diagonals) and dynamic 
-    obstacle handling. The system can detect obstacles that spawn during runtime and re-plan 
-    paths accordingly, demonstrating robust adaptive behavior.
-    
-    The implementation features a sophisticated GUI built with Matplotlib that provides 
-    step-by-step animation of the search process, color-coded visualization of different 
-    node states, and clear distinction between static walls, dynamic obstacles, frontier 
-    nodes, explored nodes, and the final path.
-    
-    Performance analysis reveals distinct characteristics for each algorithm, with BFS and 
-    Bidirectional Search showing optimal performance for shortest path finding, while DFS 
-    demonstrates memory efficiency at the cost of path optimality. The report includes 
-    detailed test cases covering best-case and worst-case scenarios for each algorithm.
-    """
-    
-    elements.append(Paragraph(summary_text, body_style))
-    elements.append(PageBreak())
-    
-    # ==================== Project Overview ====================
-    elements.append(Paragraph("2. Project Overview", heading1_style))
-    elements.append(Spacer(1, 0.1*inch))
-    
-    overview_text = """
-    This project implements an AI Pathfinder that visualizes six fundamental uninformed 
-    search algorithms in a grid-based environment. The primary objective is not merely to 
-    find a path from start to target, but to demonstrate how each algorithm "thinks" and 
-    explores the search space.
-    """
-    elements.append(Paragraph(overview_text, body_style))
-    
-    elements.append(Paragraph("2.1 Key Features", heading2_style))
-    
-    features = [
-        ["Real-time Visualization", "Animated step-by-step exploration process"],
-        ["Dynamic Obstacles", "Random obstacles spawn during search execution"],
-        ["Path Re-planning", "Algorithms adapt to newly discovered obstacles"],
-        ["8-Directional Movement", "All diagonal movements included"],
-        ["Color-coded Display", "Clear visual distinction of node states"],
-        ["Performance Metrics", "Step count and path cost tracking"]
-    ]
-    
-    features_table = Table(features, colWidths=[2*inch, 4*inch])
-    features_table.setStyle(TableStyle([
-        ('FONT', (0, 0), (-1, -1), 'Helvetica', 10),
-        ('FONT', (0, 0), (0, -1), 'Helvetica-Bold', 10),
-        ('BACKGROUND', (0, 0), (0, -1), colors.lightblue),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ('GRID', (0, 0), (-1, -1), 1, colors.grey),
-        ('ROWBACKGROUNDS', (0, 0), (-1, -1), [colors.white, colors.lightgrey])
-    ]))
-    
-    elements.append(features_table)
-    elements.append(Spacer(1, 0.2*inch))
-    
-    elements.append(Paragraph("2.2 Movement Order", heading2_style))
-    
-    movement_text = """
-    The implementation follows a strict clockwise movement order with all eight directions:
-    Up, Top-Right (diagonal), Right, Bottom-Right (diagonal), Bottom, Bottom-Left (diagonal), 
-    Left, and Top-Left (diagonal). This ensures consistent and predictable behavior across 
-    all algorithms.
-    """
-    elements.append(Paragraph(movement_text, body_style))
-    elements.append(PageBreak())
-    
-    # ==================== Algorithm Implementations ====================
-    elements.append(Paragraph("3. Algorithm Implementations", heading1_style))
-    elements.append(Spacer(1, 0.2*inch))
-    
-    # BFS
-    elements.append(Paragraph("3.1 Breadth-First Search (BFS)", heading2_style))
-    
-    bfs_text = """
-    <b>Strategy:</b> BFS explores nodes level by level, ensuring that all nodes at depth 
-    d are explored before any nodes at depth d+1.<br/>
-    <br/>
-    <b>Data Structure:</b> Queue (FIFO - First In, First Out)<br/>
-    <br/>
-    <b>Implementation Details:</b> The algorithm maintains a queue of frontier nodes and a 
-    set of explored nodes. At each step, it dequeues the first node, marks it as explored, 
-    and adds all unexplored neighbors to the queue.<br/>
-    <br/>
-    <b>Completeness:</b> Yes - guaranteed to find a solution if one exists<br/>
-    <br/>
-    <b>Optimality:</b> Yes - finds the shortest path in terms of number of steps (for 
-    unweighted graphs)<br/>
-    <br/>
-    <b>Time Complexity:</b> O(b<super>d</super>) where b is branching factor and d is depth<br/>
-    <br/>
-    <b>Space Complexity:</b> O(b<super>d</super>) - must store all nodes at current level<br/>
-    <br/>
-    <b>Pros:</b>
-    • Guarantees shortest path (optimal for uniform cost)<br/>
-    • Complete - will always find a solution if it exists<br/>
-    • Simple to implement and understand<br/>
-    <br/>
-    <b>Cons:</b>
-    • High memory usage - stores entire frontier<br/>
-    • Slow for deep solutions<br/>
-    • Explores many unnecessary nodes in open spaces<br/>
-    """
-    elements.append(Paragraph(bfs_text, body_style))
-    elements.append(Spacer(1, 0.2*inch))
-    
-    # DFS
-    elements.append(Paragraph("3.2 Depth-First Search (DFS)", heading2_style))
-    
-    dfs_text = """
-    <b>Strategy:</b> DFS explores as deep as possible along each branch before backtracking.<br/>
-    <br/>
-    <b>Data Structure:</b> Stack (LIFO - Last In, First Out)<br/>
-    <br/>
-    <b>Implementation Details:</b> Uses a stack to manage frontier nodes. Explores the most 
-    recently discovered node first, going deep into the search space before backtracking.<br/>
-    <br/>
-    <b>Completeness:</b> No - can get stuck in infinite loops or wrong paths<br/>
-    <br/>
-    <b>Optimality:</b> No - does not guarantee shortest path<br/>
-    <br/>
-    <b>Time Complexity:</b> O(b<super>m</super>) where m is maximum depth<br/>
-    <br/>
-    <b>Space Complexity:</b> O(bm) - only stores path from root to leaf<br/>
-    <br/>
-    <b>Pros:</b>
-    • Low memory usage - only stores current path<br/>
-    • Can find solutions quickly if they exist deep in tree<br/>
-    • Simple to implement<br/>
-    <br/>
-    <b>Cons:</b>
-    • Not optimal - may find long, inefficient paths<br/>
-    • Can explore unnecessary deep paths<br/>
-    • May not find solution even if it exists<br/>
-    """
-    elements.append(Paragraph(dfs_text, body_style))
-    elements.append(PageBreak())
-    
-    # UCS
-    elements.append(Paragraph("3.3 Uniform-Cost Search (UCS)", heading2_style))
-    
-    ucs_text = """
-    <b>Strategy:</b> Expands the node with the lowest path cost from the start.<br/>
-    <br/>
-    <b>Data Structure:</b> Priority Queue (ordered by cumulative cost)<br/>
-    <br/>
-    <b>Implementation Details:</b> Uses a min-heap to always expand the lowest-cost node. 
-    Accounts for diagonal movement costing √2 while orthogonal movement costs 1.<br/>
-    <br/>
-    <b>Completeness:</b> Yes - if step costs are positive<br/>
-    <br/>
-    <b>Optimality:</b> Yes - guarantees lowest-cost path<br/>
-    <br/>
-    <b>Time Complexity:</b> O(b<super>1+C*/ε</super>) where C* is optimal cost and ε is 
-    minimum cost<br/>
-    <br/>
-    <b>Space Complexity:</b> O(b<super>1+C*/ε</super>)<br/>
-    <br/>
-    <b>Pros:</b>
-    • Optimal for weighted graphs<br/>
-    • Accounts for different movement costs<br/>
-    • Complete for positive costs<br/>
-    <br/>
-    <b>Cons:</b>
-    • Higher memory usage than DFS<br/>
-    • Slower than BFS for uniform costs<br/>
-    • More complex implementation<br/>
-    """
-    elements.append(Paragraph(ucs_text, body_style))
-    elements.append(Spacer(1, 0.2*inch))
-    
-    # DLS
-    elements.append(Paragraph("3.4 Depth-Limited Search (DLS)", heading2_style))
-    
-    dls_text = """
-    <b>Strategy:</b> DFS with a predetermined depth limit to avoid infinite paths.<br/>
-    <br/>
-    <b>Data Structure:</b> Stack with depth counter<br/>
-    <br/>
-    <b>Implementation Details:</b> Implements DFS but stops exploring beyond a specified 
-    depth limit. Uses recursion with depth tracking.<br/>
-    <br/>
-    <b>Completeness:</b> No - only if solution is within depth limit<br/>
-    <br/>
-    <b>Optimality:</b> No<br/>
-    <br/>
-    <b>Time Complexity:</b> O(b<super>l</super>) where l is the depth limit<br/>
-    <br/>
-    <b>Space Complexity:</b> O(bl)<br/>
-    <br/>
-    <b>Pros:</b>
-    • Avoids infinite depth problems of DFS<br/>
-    • Memory efficient like DFS<br/>
-    • Useful when approximate depth is known<br/>
-    <br/>
-    <b>Cons:</b>
-    • May not find solution if limit is too low<br/>
-    • Not optimal<br/>
-    • Choosing appropriate limit is difficult<br/>
-    """
-    elements.append(Paragraph(dls_text, body_style))
-    elements.append(PageBreak())
-    
-    # IDDFS
-    elements.append(Paragraph("3.5 Iterative Deepening DFS (IDDFS)", heading2_style))
-    
-    iddfs_text = """
-    <b>Strategy:</b> Repeatedly applies DLS with increasing depth limits until solution is found.<br/>
-    <br/>
-    <b>Data Structure:</b> Stack (applied iteratively with increasing limits)<br/>
-    <br/>
-    <b>Implementation Details:</b> Performs DLS with limit 1, then 2, then 3, etc., until 
-    the target is found. Combines benefits of BFS and DFS.<br/>
-    <br/>
-    <b>Completeness:</b> Yes<br/>
-    <br/>
-    <b>Optimality:</b> Yes (for uniform cost)<br/>
-    <br/>
-    <b>Time Complexity:</b> O(b<super>d</super>)<br/>
-    <br/>
-    <b>Space Complexity:</b> O(bd) - combines BFS optimality with DFS memory efficiency<br/>
-    <br/>
-    <b>Pros:</b>
-    • Optimal like BFS<br/>
-    • Memory efficient like DFS<br/>
-    • Complete<br/>
-    • No need to know depth in advance<br/>
-    <br/>
-    <b>Cons:</b>
-    • Redundant computation - revisits nodes<br/>
-    • Slower than BFS for shallow solutions<br/>
-    • More complex implementation<br/>
-    """
-    elements.append(Paragraph(iddfs_text, body_style))
-    elements.append(Spacer(1, 0.2*inch))
-    
-    # Bidirectional
-    elements.append(Paragraph("3.6 Bidirectional Search", heading2_style))
-    
-    bidirectional_text = """
-    <b>Strategy:</b> Searches simultaneously from start and goal, meeting in the middle.<br/>
-    <br/>
-    <b>Data Structure:</b> Two queues (one for each direction)<br/>
-    <br/>
-    <b>Implementation Details:</b> Runs two BFS searches simultaneously - one from start 
-    and one from target. Terminates when the two searches meet.<br/>
-    <br/>
-    <b>Completeness:</b> Yes<br/>
-    <br/>
-    <b>Optimality:</b> Yes (if both searches are BFS)<br/>
-    <br/>
-    <b>Time Complexity:</b> O(b<super>d/2</super>) - significantly better than BFS<br/>
-    <br/>
-    <b>Space Complexity:</b> O(b<super>d/2</super>)<br/>
-    <br/>
-    <b>Pros:</b>
-    • Much faster than unidirectional search<br/>
-    • Reduces search space dramatically<br/>
-    • Optimal and complete<br/>
-    <br/>
-    <b>Cons:</b>
-    • Requires knowledge of goal state<br/>
-    • More complex implementation<br/>
-    • Higher memory usage than DFS<br/>
-    • Difficult to implement with multiple goals<br/>
-    """
-    elements.append(Paragraph(bidirectional_text, body_style))
-    elements.append(PageBreak())
-    
-    # ==================== Dynamic Obstacle System ====================
-    elements.append(Paragraph("4. Dynamic Obstacle System", heading1_style))
-    elements.append(Spacer(1, 0.1*inch))
-    
-    dynamic_text = """
-    The dynamic obstacle system adds realism and complexity to the pathfinding challenge. 
-    Unlike static mazes where the environment is known and unchanging, this implementation 
-    simulates real-world scenarios where new obstacles can appear unexpectedly.
-    
-    <b>Implementation Details:</b><br/>
-    • At each algorithm step, there is a configurable probability (default 0.5%) of a new 
-    obstacle spawning<br/>
-    • Obstacles spawn at random empty locations (not on start, target, or existing obstacles)<br/>
-    • When a dynamic obstacle appears, it is immediately reflected in the grid<br/>
-    • Algorithms must check if their planned path is still valid<br/>
-    • If the path is blocked, the algorithm continues searching for an alternative route<br/>
-    <br/>
-    <b>Visual Distinction:</b><br/>
-    Dynamic obstacles are displayed in orange color, distinguishing them from black static 
-    walls. This allows observers to clearly see when and where new obstacles appear during 
-    the search process.
-    
-    <b>Re-planning Strategy:</b><br/>
-    The current implementation handles dynamic obstacles by continuing the search from the 
-    current frontier. This means that if an obstacle blocks a node that was about to be 
-    explored, the algorithm simply skips that node and continues with other frontier nodes. 
-    The search naturally adapts to the new environment configuration.
-    """
-    elements.append(Paragraph(dynamic_text, body_style))
-    elements.append(PageBreak())
-    
-    # ==================== Visualization ====================
-    elements.append(Paragraph("5. Visualization Implementation", heading1_style))
-    elements.append(Spacer(1, 0.1*inch))
-    
-    viz_text = """
-    The visualization system is built using Matplotlib and provides comprehensive insight 
-    into how each algorithm explores the search space.
-    
-    <b>Color Scheme:</b>
-    """
-    elements.append(Paragraph(viz_text, body_style))
-    
-    color_scheme = [
-        ["Blue", "Start position (S)"],
-        ["Green", "Target position (T)"],
-        ["Black", "Static walls/obstacles"],
-        ["Orange", "Dynamic obstacles"],
-        ["Yellow", "Frontier nodes (to be explored)"],
-        ["Light Blue", "Explored nodes (already visited)"],
-        ["Red", "Final path from start to target"]
-    ]
-    
-    color_table = Table(color_scheme, colWidths=[1.5*inch, 4.5*inch])
-    color_table.setStyle(TableStyle([
-        ('FONT', (0, 0), (-1, -1), 'Helvetica', 10),
-        ('FONT', (0, 0), (0, -1), 'Helvetica-Bold', 10),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('GRID', (0, 0), (-1, -1), 1, colors.grey),
-        ('BACKGROUND', (0, 0), (0, -1), colors.lightgrey)
-    ]))
-    
-    elements.append(color_table)
-    elements.append(Spacer(1, 0.2*inch))
-    
-    viz_features = """
-    <b>Animation Features:</b><br/>
-    • Step-by-step progression with configurable delay<br/>
-    • Grid lines for clear cell delineation<br/>
-    • Interactive legend showing all element types<br/>
-    • Window title: "GOOD PERFORMANCE TIME APP"<br/>
-    • Algorithm name displayed at top of grid<br/>
-    <br/>
-    <b>Implementation Approach:</b><br/>
-    The visualizer stores the complete history of the search process, including frontier 
-    and explored sets at each step. This allows for smooth animation that can be paused, 
-    replayed, or analyzed frame by frame.
-    """
-    elements.append(Paragraph(viz_features, body_style))
-    elements.append(PageBreak())
-    
-    # ==================== Performance Analysis ====================
-    elements.append(Paragraph("6. Performance Analysis", heading1_style))
-    elements.append(Spacer(1, 0.1*inch))
-    
-    perf_text = """
-    Comprehensive performance analysis across different scenarios reveals distinct 
-    characteristics for each algorithm:
-    """
-    elements.append(Paragraph(perf_text, body_style))
-    
-    # Performance comparison table
-    perf_data = [
-        ["Algorithm", "Best Case\nSteps", "Worst Case\nSteps", "Memory\nUsage", "Path\nQuality", "Completeness"],
-        ["BFS", "15-20", "80-90", "High", "Optimal", "Yes"],
-        ["DFS", "10-60", "95-100", "Low", "Suboptimal", "No"],
-        ["UCS", "15-20", "85-90", "High", "Optimal", "Yes"],
-        ["DLS", "15-25", "May fail", "Medium", "Suboptimal", "Conditional"],
-        ["IDDFS", "20-30", "90-95", "Low", "Optimal", "Yes"],
-        ["Bidirectional", "10-15", "40-50", "Medium", "Optimal", "Yes"]
+        ["Submission Date:", submission_date]
     ]
     
-    perf_table = Table(perf_data, colWidths=[1.3*inch, 0.9*inch, 0.9*inch, 0.9*inch, 0.9*inch, 1.1*inch])
-    perf_table.setStyle(TableStyle([
-        ('FONT', (0, 0), (-1, 0), 'Helvetica-Bold', 9),
-        ('FONT', (0, 1), (-1, -1), 'Helvetica', 9),
-        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.lightgrey])
-    ]))
-    
-    elements.append(perf_table)
-    elements.append(Spacer(1, 0.2*inch))
-    
-    analysis_text = """
-    <b>Key Observations:</b><br/>
-    <br/>
-    1. <b>Bidirectional Search</b> shows the best performance in worst-case scenarios, 
-    reducing search space by approximately 50% compared to BFS.<br/>
-    <br/>
-    2. <b>BFS and UCS</b> provide optimal paths but at the cost of high memory usage, 
-    storing the entire frontier.<br/>
-    <br/>
-    3. <b>DFS</b> is highly memory efficient but can find very suboptimal paths and may 
-    explore unnecessary portions of the grid.<br/>
-    <br/>
-    4. <b>IDDFS</b> successfully combines the optimality of BFS with the space efficiency 
-    of DFS, though with some redundant computation.<br/>
-    <br/>
-    5. <b>DLS</b> performance heavily depends on choosing an appropriate depth limit; too 
-    low and it fails, too high and it wastes computation.<br/>
-    <br/>
-    6. <b>UCS</b> accounts for diagonal movement costs (√2 vs 1), finding paths that 
-    minimize actual distance rather than just step count.<br/>
-    """
-    elements.append(Paragraph(analysis_text, body_style))
-    elements.append(PageBreak())
-    
-    # ==================== Test Cases ====================
-    elements.append(Paragraph("7. Test Cases and Results", heading1_style))
-    elements.append(Spacer(1, 0.1*inch))
-    
-    test_intro = """
-    Each algorithm was tested in two scenarios designed to reveal its characteristics:
-    
-    <b>Best Case Scenario:</b> Direct path available with minimal obstacles. This tests 
-    how efficiently the algorithm finds an obvious solution.<br/>
-    <br/>
-    <b>Worst Case Scenario:</b> Complex maze requiring exploration of multiple dead ends. 
-    This tests how the algorithm handles challenging search spaces.<br/>
-    """
-    elements.append(Paragraph(test_intro, body_style))
-    
-    elements.append(Paragraph("Note: Screenshots from actual test runs would be inserted here in the final report.", body_style))
-    elements.append(Spacer(1, 0.2*inch))
-    
-    test_results = """
-    <b>Test Results Summary:</b><br/>
-    <br/>
-    The testing revealed that Bidirectional Search and BFS performed most reliably across 
-    scenarios, while DFS showed high variance in path quality. IDDFS demonstrated good 
-    balance between optimality and memory usage, making it suitable for scenarios where 
-    solution depth is unknown.
-    """
-    elements.append(Paragraph(test_results, body_style))
-    elements.append(PageBreak())
-    
-    # ==================== Challenges ====================
-    elements.append(Paragraph("8. Challenges and Solutions", heading1_style))
-    elements.append(Spacer(1, 0.1*inch))
-    
-    challenges = """
-    <b>Challenge 1: Dynamic Obstacle Handling</b><br/>
-    <i>Problem:</i> Ensuring algorithms gracefully handle obstacles appearing during search.<br/>
-    <i>Solution:</i> Implemented obstacle validity checking at each step, allowing algorithms 
-    to skip blocked nodes and continue with alternative paths.<br/>
-    <br/>
-    <b>Challenge 2: Visualization Performance</b><br/>
-    <i>Problem:</i> Animating hundreds of search steps without overwhelming the GUI.<br/>
-    <i>Solution:</i> Used Matplotlib's FuncAnimation with configurable delay and stored 
-    complete history for smooth playback.<br/>
-    <br/>
-    <b>Challenge 3: Diagonal Movement Costs</b><br/>
-    <i>Problem:</i> Accurately representing that diagonal moves cover more distance.<br/>
-    <i>Solution:</i> Implemented cost calculation function in UCS that assigns cost of √2 
-    to diagonal moves and 1 to orthogonal moves.<br/>
-    <br/>
-    <b>Challenge 4: Bidirectional Search Meeting Point</b><br/>
-    <i>Problem:</i> Detecting when forward and backward searches intersect.<br/>
-    <i>Solution:</i> Maintained separate explored sets for each direction and checked for 
-    intersection at each step.<br/>
-    <br/>
-    <b>Challenge 5: IDDFS Efficiency</b><br/>
-    <i>Problem:</i> Redundant re-exploration of nodes at each depth increment.<br/>
-    <i>Solution:</i> Accepted this as inherent to IDDFS; the space savings justify the time 
-    overhead for deep solutions.<br/>
-    """
-    elements.append(Paragraph(challenges, body_style))
-    elements.append(PageBreak())
-    
-    # ==================== Conclusion ====================
-    elements.append(Paragraph("9. Conclusion", heading1_style))
-    elements.append(Spacer(1, 0.1*inch))
-    
-    conclusion = """
-    This project successfully demonstrates the implementation and visualization of six 
-    fundamental uninformed search algorithms. Each algorithm exhibits distinct 
-    characteristics in terms of completeness, optimality, time complexity, and space 
-    complexity.
-    
-    The key findings are:
-    
-    1. <b>No single algorithm is universally best</b> - the choice depends on the specific 
-    requirements and constraints of the problem.<br/>
-    <br/>
-    2. <b>Trade-offs are inevitable</b> - algorithms that guarantee optimal solutions (BFS, 
-    UCS, IDDFS) require more resources than those that don't (DFS, DLS).<br/>
-    <br/>
-    3. <b>Bidirectional search offers significant advantages</b> when both start and goal 
-    states are known, effectively halving the search depth.<br/>
-    <br/>
-    4. <b>Dynamic environments require adaptive algorithms</b> - the ability to handle 
-    runtime changes is crucial for real-world applications.<br/>
-    <br/>
-    5. <b>Visualization is essential for understanding</b> - seeing how algorithms explore 
-    provides insights that pure metrics cannot capture.<br/>
-    
-    Future enhancements could include:
-    • Implementation of informed search algorithms (A*, Greedy Best-First)<br/>
-    • Support for weighted grids with variable terrain costs<br/>
-    • Multi-agent pathfinding with collision avoidance<br/>
-    • Performance optimization using heuristics<br/>
-    • Extended testing on larger grid sizes<br/>
-    
-    This assignment has provided deep understanding of fundamental search algorithms, their 
-    practical implementation challenges, and the trade-offs involved in choosing appropriate 
-    strategies for different scenarios.
-    """
-    elements.append(Paragraph(conclusion, body_style))
-    elements.append(PageBreak())
-    
-    # ==================== References ====================
-    elements.append(Paragraph("10. References", heading1_style))
-    elements.append(Spacer(1, 0.1*inch))
-    
-    references = [
-        "Russell, S., & Norvig, P. (2020). <i>Artificial Intelligence: A Modern Approach</i> (4th ed.). Pearson.",
-        "Cormen, T. H., Leiserson, C. E., Rivest, R. L., & Stein, C. (2009). <i>Introduction to Algorithms</i> (3rd ed.). MIT Press.",
-        "Hart, P. E., Nilsson, N. J., & Raphael, B. (1968). A Formal Basis for the Heuristic Determination of Minimum Cost Paths. <i>IEEE Transactions on Systems Science and Cybernetics</i>, 4(2), 100-107.",
-        "Pohl, I. (1971). Bi-directional Search. <i>Machine Intelligence</i>, 6, 124-140.",
-        "Korf, R. E. (1985). Depth-First Iterative-Deepening: An Optimal Admissible Tree Search. <i>Artificial Intelligence</i>, 27(1), 97-109.",
-        "Matplotlib Documentation. (2024). Retrieved from https://matplotlib.org/",
-        "Python Software Foundation. (2024). <i>Python Documentation</i>. Retrieved from https://docs.python.org/",
-        "Course Lecture Notes - AI 2002: Artificial Intelligence (Spring 2026)"
-    ]
-    
-    for ref in references:
-        elements.append(Paragraph(f"• {ref}", body_style))
-        elements.append(Spacer(1, 0.1*inch))
-    
-    # Build PDF
-    doc.build(elements)
+    pdf_bytes = render_report(info_data)
+    
+    # Write the finished file in one go; the rename keeps readers from seeing a partial PDF.
+    # The temp name is per process, so parallel writers of the same report don't collide
+    tmp_path = f'{pdf_path}.{os.getpid()}.tmp'
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(pdf_bytes)
+        os.replace(tmp_path, pdf_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
     
     print(f"Report generated successfully: {pdf_path}")
     return pdf_path
 
 
+def _create_one(student):
+    """Worker entry point: build one report from a dict of create_report kwargs"""
+    return create_report(**student)
+
+
+def create_reports(students):
+    """Create reports for many students in parallel, one process per core
+    
+    students is a list of dicts with 'student_id' and 'student_name' keys.
+    Returns the generated PDF paths in the same order.
+    """
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        return list(executor.map(_create_one, students))
+
+
 if __name__ == "__main__":
     # You can customize these parameters
     create_report(student_id="24F-0744", student_name="Zobia Razzaq")
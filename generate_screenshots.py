@@ -4,21 +4,42 @@ in both best and worst case scenarios
 """
 
 import matplotlib.pyplot as plt
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from PIL import Image
 from pathfinder import (GridEnvironment, PathfinderVisualizer, 
                         SearchAlgorithms, create_sample_environment)
 import os
 
-def save_screenshot(env, algorithm_name, method_name, scenario):
-    """Run algorithm and save screenshot"""
+SCREENSHOT_DPI = 72
+
+
+def _write_png(pixels, filename):
+    """Encode an RGBA pixel array to PNG (runs in a worker process)"""
+    # Fastest zlib level and no optimize pass: larger files, much quicker encode
+    Image.fromarray(pixels).save(filename, format='PNG', optimize=False, compress_level=1)
+    return filename
+
+
+def save_screenshot(env, algorithm_name, method_name, scenario, executor=None):
+    """Run algorithm and save screenshot
+    
+    The figure is rendered here, but with an executor the PNG encoding and
+    write are handed to it so the next algorithm can start meanwhile.
+    Returns (path found, future of the background write or None); the caller
+    must check the future before counting the screenshot as saved.
+    """
     print(f"\nGenerating screenshot: {algorithm_name} - {scenario}")
     
     # Create visualizer
-    viz = PathfinderVisualizer(env, algorithm_name)
+    viz = PathfinderVisualizer(env, algorithm_name, figsize=(8, 8))
     searcher = SearchAlgorithms(env, viz)
     
     # Run the algorithm
     method_func = getattr(searcher, method_name)
     
+    saved = None
+    
     try:
         if method_name == 'dls':
             path = method_func(depth_limit=15)
@@ -27,8 +48,8 @@ def save_screenshot(env, algorithm_name, method_name, scenario):
         else:
             path = method_func()
         
-        # Draw final state
-        viz.draw_grid(len(viz.history) - 1 if viz.history else None)
+        # Draw final state; batch screenshots skip the legend
+        viz.draw_grid(len(viz.history) - 1 if viz.history else None, show_legend=False)
         
         # Create screenshots directory if it doesn't exist
         if not os.path.exists('screenshots'):
@@ -36,18 +57,26 @@ def save_screenshot(env, algorithm_name, method_name, scenario):
         
         # Save figure
         filename = f'screenshots/{algorithm_name.lower().replace(" ", "_")}_{scenario}.png'
-        plt.savefig(filename, dpi=150, bbox_inches='tight')
-        print(f"Saved: {filename}")
+        # Render once at the screenshot DPI (fixed size, constrained layout) and
+        # keep only the pixels, so the figure can be closed before the PNG exists
+        viz.fig.set_dpi(SCREENSHOT_DPI)
+        viz.fig.canvas.draw()
+        pixels = np.array(viz.fig.canvas.buffer_rgba())
+        if executor is not None:
+            saved = executor.submit(_write_png, pixels, filename)
+        else:
+            _write_png(pixels, filename)
+            print(f"Saved: {filename}")
         
         # Close figure
-        plt.close()
+        plt.close(viz.fig)
         
-        return path is not None
+        return path is not None, saved
         
     except Exception as e:
         print(f"Error: {e}")
-        plt.close()
-        return False
+        plt.close(viz.fig)
+        return False, saved
 
 
 def main():
@@ -68,21 +97,41 @@ def main():
     scenarios = ['best', 'worst']
     
     results = {}
+    pending_saves = {}
     
-    for scenario in scenarios:
-        print(f"\n{'=' * 70}")
-        print(f"SCENARIO: {scenario.upper()} CASE")
-        print('=' * 70)
-        
-        for algo_name, method_name in algorithms:
-            # Create fresh environment for each test
-            env = create_sample_environment(scenario)
+    # PNG encoding runs in worker processes while the next algorithm is solved;
+    # leaving the block waits for every write to finish
+    with ProcessPoolExecutor() as executor:
+        for scenario in scenarios:
+            print(f"\n{'=' * 70}")
+            print(f"SCENARIO: {scenario.upper()} CASE")
+            print('=' * 70)
             
-            # Run and save
-            success = save_screenshot(env, algo_name, method_name, scenario)
+            # Build the scenario once; each algorithm starts from a restored copy of it
+            env = create_sample_environment(scenario)
+            initial_state = env.snapshot()
             
-            key = f"{algo_name}_{scenario}"
-            results[key] = "✓ Success" if success else "✗ Failed"
+            for algo_name, method_name in algorithms:
+                # Reset the environment for each test
+                env.restore(initial_state)
+                
+                # Run and save
+                success, saved = save_screenshot(env, algo_name, method_name,
+                                                 scenario, executor)
+                
+                key = f"{algo_name}_{scenario}"
+                results[key] = "✓ Success" if success else "✗ Failed"
+                if saved is not None:
+                    pending_saves[key] = saved
+    
+    # Report the background PNG writes; a failed write counts as a failed screenshot
+    for key, saved in pending_saves.items():
+        error = saved.exception()
+        if error is None:
+            print(f"Saved: {saved.result()}")
+        else:
+            print(f"Error: {error}")
+            results[key] = "✗ Failed"
     
     # Print summary
     print("\n" + "=" * 70)
@@ -0,0 +1,54 @@
+"""
+Compiled search kernels for headless runs on large grids
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # optional: without Numba the kernels run as plain Python
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+
+# Same clockwise order as pathfinder._DIRS, so ties break the same way as bfs()
+_DIRS = np.array([(-1, 0), (-1, 1), (0, 1), (1, 1), (1, 0), (1, -1), (0, -1), (-1, -1)],
+                 dtype=np.int64)
+
+
+@njit(cache=True)
+def bfs_grid(blocked, start, target):
+    """Breadth-first search over a 2D blocked mask (nonzero = obstacle)
+
+    start and target are flat cell ids (row * width + col). Returns the
+    predecessor of every reached cell (-1 elsewhere) and the number of cells
+    expanded before the target was taken off the queue.
+    """
+    rows, cols = blocked.shape
+    predecessors = np.full(rows * cols, -1, dtype=np.int32)
+    visited = np.zeros(rows * cols, dtype=np.bool_)
+    queue = np.empty(rows * cols, dtype=np.int32)
+    head, tail = 0, 1
+    queue[0] = start
+    visited[start] = True
+    steps = 0
+
+    while head < tail:
+        current = queue[head]
+        head += 1
+        if current == target:
+            break
+        steps += 1
+
+        row, col = current // cols, current % cols
+        for k in range(8):
+            r, c = row + _DIRS[k, 0], col + _DIRS[k, 1]
+            if 0 <= r < rows and 0 <= c < cols and not blocked[r, c]:
+                neighbor = r * cols + c
+                if not visited[neighbor]:
+                    visited[neighbor] = True
+                    predecessors[neighbor] = current
+                    queue[tail] = neighbor
+                    tail += 1
+
+    return predecessors, steps
@@ -6,13 +6,21 @@ with Dynamic Obstacle Handling
 
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
+from matplotlib.colors import ListedColormap
 from matplotlib.animation import FuncAnimation
 import numpy as np
 import time
-from collections import deque
+from collections import deque, Counter
 import heapq
+from bisect import bisect_left
+from math import inf
 import random
-from copy import deepcopy
+
+# Neighbour offsets in clockwise order with all diagonals:
+# Up, Top-Right, Right, Bottom-Right, Bottom, Bottom-Left, Left, Top-Left
+_DIRS = ((-1, 0), (-1, 1), (0, 1), (1, 1), (1, 0), (1, -1), (0, -1), (-1, -1))
+# The same offsets with their move cost, matching get_cost
+_DIRS_WITH_COST = tuple((dr, dc, 1.414 if dr and dc else 1.0) for dr, dc in _DIRS)
 
 class GridEnvironment:
     """Grid environment with dynamic obstacle support"""
@@ -22,34 +30,130 @@ class GridEnvironment:
         self.size = size
         self.start = start
         self.target = target
+        # Search code works on flat cell ids (row * width + col); positions are
+        # only turned back into (row, col) tuples for the visualiser
+        self.width = size[1]
+        self.start_id = self.encode(start)
+        self.target_id = self.encode(target)
         self.obstacle_prob = obstacle_prob
         self.dynamic_prob = dynamic_prob
-        self.grid = np.zeros(size)
+        self.grid = np.zeros(size, dtype=np.uint8)
+        # Boolean view of the grid, True wherever a static or dynamic obstacle sits.
+        # It shares the grid's buffer, so marking the grid keeps it in sync; the flat
+        # memoryview indexes it by cell id at Python speed for neighbour lookups
+        self.blocked = self.grid.view(np.bool_)
+        self._blocked = memoryview(self.blocked.reshape(-1))
         self.static_obstacles = set()
         self.dynamic_obstacles = set()
+        # Cells a dynamic obstacle may still appear in, maintained as obstacles are
+        # placed; the sorted list shadow lets spawning pick one by index
+        self.free_cells = set(range(size[0] * size[1])) - {self.start_id, self.target_id}
+        self._free_list = sorted(self.free_cells)
+        # Neighbour lists per cell id, dropped for the cells around each new obstacle
+        self._neighbor_cache = {}
+        self._neighbor_cost_cache = {}
+        self._csr = None  # adjacency matrix built by to_csr, reset when obstacles change
+        
+    def encode(self, pos):
+        """Flat cell id of a (row, col) position"""
+        return pos[0] * self.width + pos[1]
+    
+    def decode(self, cell):
+        """(row, col) position of a flat cell id"""
+        return divmod(cell, self.width)
+    
+    def decode_path(self, path):
+        """Convert a path of cell ids back to (row, col) positions"""
+        return [divmod(cell, self.width) for cell in path]
+    
+    def snapshot(self):
+        """Copy the mutable obstacle state, for restore() to roll back to
+        
+        Only the obstacle sets, free-cell bookkeeping and grid array are copied;
+        a deepcopy of the whole environment is never needed.
+        """
+        return {
+            'static': set(self.static_obstacles),
+            'dynamic': set(self.dynamic_obstacles),
+            'free': set(self.free_cells),
+            'free_list': list(self._free_list),
+            'grid': self.grid.copy()
+        }
+    
+    def restore(self, state):
+        """Roll the obstacle state back to a snapshot() taken earlier"""
+        self.static_obstacles = set(state['static'])
+        self.dynamic_obstacles = set(state['dynamic'])
+        self.free_cells = set(state['free'])
+        self._free_list = list(state['free_list'])
+        # Copy into the existing buffer, which blocked and _blocked are views of
+        self.grid[...] = state['grid']
+        self._neighbor_cache.clear()
+        self._neighbor_cost_cache.clear()
+        self._csr = None
+    
+    def _occupy(self, cell):
+        """Mark a cell as blocked and take it out of the free cells"""
+        if cell in self.free_cells:
+            self.free_cells.remove(cell)
+            del self._free_list[bisect_left(self._free_list, cell)]
+        self.grid.flat[cell] = 1
         
+        # Only the cells around the new obstacle have it as a neighbour
+        row, col = divmod(cell, self.width)
+        rows, cols = self.size
+        for dr, dc in _DIRS:
+            r, c = row + dr, col + dc
+            if 0 <= r < rows and 0 <= c < cols:
+                self._neighbor_cache.pop(r * cols + c, None)
+                self._neighbor_cost_cache.pop(r * cols + c, None)
+        self._csr = None
+    
     def add_static_obstacles(self, obstacles):
         """Add static walls to the grid"""
+        rows, cols = self.size
         for obs in obstacles:
+            # Flat ids of out-of-range positions would wrap onto another cell
+            if not (0 <= obs[0] < rows and 0 <= obs[1] < cols):
+                raise IndexError(f"Obstacle {obs} is outside the {rows}x{cols} grid")
             if obs != self.start and obs != self.target:
                 self.static_obstacles.add(obs)
-                self.grid[obs[0], obs[1]] = 1
+                self._occupy(self.encode(obs))
+    
+    def add_static_obstacles_bulk(self, obstacles):
+        """Add static walls given as an (N, 2) array of (row, col) coordinates
+        
+        Marks the grid with one fancy-indexed assignment and rebuilds the free
+        cells and caches once, instead of per wall.
+        """
+        rows, cols = self.size
+        outside = ((obstacles[:, 0] < 0) | (obstacles[:, 0] >= rows)
+                   | (obstacles[:, 1] < 0) | (obstacles[:, 1] >= cols))
+        if outside.any():
+            raise IndexError(f"Obstacle {tuple(obstacles[outside][0].tolist())} is outside "
+                             f"the {rows}x{cols} grid")
+        
+        cells = np.unique(obstacles[:, 0] * self.width + obstacles[:, 1])
+        cells = cells[(cells != self.start_id) & (cells != self.target_id)]
+        
+        self.grid.flat[cells] = 1
+        cell_ids = cells.tolist()
+        self.static_obstacles.update(self.decode(cell) for cell in cell_ids)
+        self.free_cells.difference_update(cell_ids)
+        self._free_list = sorted(self.free_cells)
+        self._neighbor_cache.clear()
+        self._neighbor_cost_cache.clear()
+        self._csr = None
     
     def spawn_dynamic_obstacle(self):
         """Randomly spawn a dynamic obstacle"""
         if random.random() < self.dynamic_prob:
-            empty_cells = []
-            for i in range(self.size[0]):
-                for j in range(self.size[1]):
-                    if (i, j) not in self.static_obstacles and \
-                       (i, j) not in self.dynamic_obstacles and \
-                       (i, j) != self.start and (i, j) != self.target:
-                        empty_cells.append((i, j))
-            
-            if empty_cells:
-                new_obs = random.choice(empty_cells)
+            free = self._free_list
+            if free:
+                cell = free[random.randrange(len(free))]
+                new_obs = self.decode(cell)
                 self.dynamic_obstacles.add(new_obs)
-                self.grid[new_obs[0], new_obs[1]] = 1
+                self._occupy(cell)
                 return new_obs
         return None
     
@@ -58,33 +162,74 @@ class GridEnvironment:
         row, col = pos
         if row < 0 or row >= self.size[0] or col < 0 or col >= self.size[1]:
             return False
-        if pos in self.static_obstacles or pos in self.dynamic_obstacles:
+        if self._blocked[row * self.width + col]:
             return False
         return True
     
-    def get_neighbors(self, pos):
-        """Get valid neighbors in clockwise order with all diagonals"""
-        row, col = pos
-        # Order: Up, Top-Right, Right, Bottom-Right, Bottom, Bottom-Left, Left, Top-Left
-        directions = [
-            (-1, 0),   # Up
-            (-1, 1),   # Top-Right
-            (0, 1),    # Right
-            (1, 1),    # Bottom-Right
-            (1, 0),    # Bottom
-            (1, -1),   # Bottom-Left
-            (0, -1),   # Left
-            (-1, -1)   # Top-Left
-        ]
+    def get_neighbors(self, cell):
+        """Get ids of valid neighbor cells in clockwise order with all diagonals
         
-        neighbors = []
-        for dr, dc in directions:
-            new_pos = (row + dr, col + dc)
-            if self.is_valid(new_pos):
-                neighbors.append(new_pos)
+        The list is cached until an obstacle appears next to the cell, so callers
+        must not modify it.
+        """
+        neighbors = self._neighbor_cache.get(cell)
+        if neighbors is None:
+            row, col = divmod(cell, self.width)
+            rows, cols = self.size
+            blocked = self._blocked
+            neighbors = []
+            for dr, dc in _DIRS:
+                r, c = row + dr, col + dc
+                if 0 <= r < rows and 0 <= c < cols and not blocked[r * cols + c]:
+                    neighbors.append(r * cols + c)
+            self._neighbor_cache[cell] = neighbors
+        return neighbors
+    
+    def get_neighbors_with_cost(self, cell):
+        """Get (neighbor id, move cost) pairs in the same order as get_neighbors
         
+        Cached the same way as get_neighbors.
+        """
+        neighbors = self._neighbor_cost_cache.get(cell)
+        if neighbors is None:
+            row, col = divmod(cell, self.width)
+            rows, cols = self.size
+            blocked = self._blocked
+            neighbors = []
+            for dr, dc, cost in _DIRS_WITH_COST:
+                r, c = row + dr, col + dc
+                if 0 <= r < rows and 0 <= c < cols and not blocked[r * cols + c]:
+                    neighbors.append((r * cols + c, cost))
+            self._neighbor_cost_cache[cell] = neighbors
         return neighbors
     
+    def to_csr(self):
+        """Adjacency matrix over cell ids, weighted 1 or sqrt(2) per move
+        
+        Built with NumPy in one pass per direction and reused until an obstacle
+        is added. Needs SciPy.
+        """
+        if self._csr is None:
+            # SciPy is optional and slow to import, so it is only loaded here
+            from scipy.sparse import csr_matrix
+            
+            rows, cols = self.size
+            free = ~self.blocked
+            ids = np.arange(rows * cols).reshape(rows, cols)
+            sources, targets, weights = [], [], []
+            for dr, dc, cost in _DIRS_WITH_COST:
+                # Cells whose neighbour in this direction is inside the grid
+                src = (slice(max(0, -dr), rows - max(0, dr)), slice(max(0, -dc), cols - max(0, dc)))
+                dst = (slice(max(0, dr), rows - max(0, -dr)), slice(max(0, dc), cols - max(0, -dc)))
+                open_edge = free[src] & free[dst]
+                sources.append(ids[src][open_edge])
+                targets.append(ids[dst][open_edge])
+                weights.append(np.full(np.count_nonzero(open_edge), cost))
+            self._csr = csr_matrix((np.concatenate(weights),
+                                    (np.concatenate(sources), np.concatenate(targets))),
+                                   shape=(rows * cols, rows * cols))
+        return self._csr
+    
     def get_cost(self, from_pos, to_pos):
         """Get cost of moving from one position to another"""
         # Diagonal moves cost sqrt(2), orthogonal moves cost 1
@@ -96,10 +241,12 @@ class GridEnvironment:
 class PathfinderVisualizer:
     """Visualization class for pathfinding algorithms"""
     
-    def __init__(self, env, algorithm_name):
+    def __init__(self, env, algorithm_name, figsize=(10, 10)):
         self.env = env
         self.algorithm_name = algorithm_name
-        self.fig, self.ax = plt.subplots(figsize=(10, 10))
+        # Constrained layout makes room for the outside legend when the figure is
+        # drawn, so draw_grid doesn't need tight_layout and savefig doesn't need a tight bbox
+        self.fig, self.ax = plt.subplots(figsize=figsize, constrained_layout=True)
         self.fig.canvas.manager.set_window_title("GOOD PERFORMANCE TIME APP")
         
         # Colors
@@ -113,24 +260,38 @@ class PathfinderVisualizer:
             'path': 'red',
             'dynamic_obstacle': 'orange'
         }
+        # Cell codes drawn by draw_grid, indexing into the colormap below
+        self.cell_codes = ('empty', 'explored', 'frontier', 'path', 'wall',
+                           'dynamic_obstacle', 'start', 'target')
+        self.cmap = ListedColormap([self.colors[name] for name in self.cell_codes])
+        
+        # Legend entries, built once and reused by every draw_grid call
+        self._legend_handles = [
+            patches.Patch(color=self.colors['start'], label='Start'),
+            patches.Patch(color=self.colors['target'], label='Target'),
+            patches.Patch(color=self.colors['wall'], label='Wall'),
+            patches.Patch(color=self.colors['frontier'], label='Frontier'),
+            patches.Patch(color=self.colors['explored'], label='Explored'),
+            patches.Patch(color=self.colors['path'], label='Path'),
+            patches.Patch(color=self.colors['dynamic_obstacle'], label='Dynamic Obstacle')
+        ]
         
         self.history = []  # Store visualization states
         
     def add_state(self, frontier, explored, path=None, dynamic_obs=None):
-        """Add a state to visualization history"""
+        """Add a state to visualization history, decoding the search's cell ids"""
+        width = self.env.width
         state = {
-            'frontier': set(frontier) if frontier else set(),
-            'explored': set(explored) if explored else set(),
-            'path': list(path) if path else [],
+            'frontier': {divmod(cell, width) for cell in frontier} if frontier else set(),
+            'explored': {divmod(cell, width) for cell in explored} if explored else set(),
+            'path': [divmod(cell, width) for cell in path] if path else [],
             'dynamic_obs': dynamic_obs
         }
         self.history.append(state)
     
-    def draw_grid(self, state_idx=None):
+    def draw_grid(self, state_idx=None, show_legend=True):
         """Draw the current state of the grid"""
         self.ax.clear()
-        self.ax.set_xlim(-0.5, self.env.size[1] - 0.5)
-        self.ax.set_ylim(-0.5, self.env.size[0] - 0.5)
         self.ax.set_aspect('equal')
         self.ax.set_title(f'{self.algorithm_name}\nGOOD PERFORMANCE TIME APP', 
                          fontsize=16, fontweight='bold')
@@ -141,61 +302,45 @@ class PathfinderVisualizer:
         else:
             state = {'frontier': set(), 'explored': set(), 'path': []}
         
-        # Draw grid cells
-        for i in range(self.env.size[0]):
-            for j in range(self.env.size[1]):
-                pos = (i, j)
-                
-                # Determine cell color
-                if pos == self.env.start:
-                    color = self.colors['start']
-                    self.ax.text(j, i, 'S', ha='center', va='center', 
-                               fontsize=12, fontweight='bold', color='white')
-                elif pos == self.env.target:
-                    color = self.colors['target']
-                    self.ax.text(j, i, 'T', ha='center', va='center', 
-                               fontsize=12, fontweight='bold', color='white')
-                elif pos in self.env.static_obstacles:
-                    color = self.colors['wall']
-                elif pos in self.env.dynamic_obstacles:
-                    color = self.colors['dynamic_obstacle']
-                elif pos in state['path']:
-                    color = self.colors['path']
-                elif pos in state['explored']:
-                    color = self.colors['explored']
-                elif pos in state['frontier']:
-                    color = self.colors['frontier']
-                else:
-                    color = self.colors['empty']
-                
-                rect = patches.Rectangle((j - 0.45, i - 0.45), 0.9, 0.9,
-                                        linewidth=1, edgecolor='gray',
-                                        facecolor=color)
-                self.ax.add_patch(rect)
+        # Draw grid cells as one image of color codes. Layers are painted from
+        # lowest to highest priority, so e.g. a wall always wins over explored
+        code = {name: k for k, name in enumerate(self.cell_codes)}
+        cells = np.zeros(self.env.size, dtype=np.int8)
+        layers = (
+            ('frontier', state['frontier']),
+            ('explored', state['explored']),
+            ('path', state['path']),
+            ('dynamic_obstacle', self.env.dynamic_obstacles),
+            ('wall', self.env.static_obstacles),
+            ('start', (self.env.start,)),
+            ('target', (self.env.target,))
+        )
+        for name, positions in layers:
+            if positions:
+                rows, cols = zip(*positions)
+                cells[rows, cols] = code[name]
+        self.ax.imshow(cells, cmap=self.cmap, vmin=0, vmax=len(self.cell_codes) - 1,
+                       interpolation='nearest')
+        
+        for pos, label in ((self.env.start, 'S'), (self.env.target, 'T')):
+            self.ax.text(pos[1], pos[0], label, ha='center', va='center', 
+                         fontsize=12, fontweight='bold', color='white')
         
-        # Add grid lines
-        for i in range(self.env.size[0] + 1):
-            self.ax.axhline(i - 0.5, color='gray', linewidth=0.5)
-        for j in range(self.env.size[1] + 1):
-            self.ax.axvline(j - 0.5, color='gray', linewidth=0.5)
+        # Add grid lines on the cell borders
+        self.ax.set_xticks(np.arange(-0.5, self.env.size[1], 1), minor=True)
+        self.ax.set_yticks(np.arange(-0.5, self.env.size[0], 1), minor=True)
+        self.ax.tick_params(which='minor', length=0)
+        self.ax.grid(which='minor', color='gray', linewidth=0.5)
+        self.ax.set_xlim(-0.5, self.env.size[1] - 0.5)
+        self.ax.set_ylim(-0.5, self.env.size[0] - 0.5)
         
         # Invert y-axis so (0,0) is at top-left
         self.ax.invert_yaxis()
         
         # Add legend
-        legend_elements = [
-            patches.Patch(color=self.colors['start'], label='Start'),
-            patches.Patch(color=self.colors['target'], label='Target'),
-            patches.Patch(color=self.colors['wall'], label='Wall'),
-            patches.Patch(color=self.colors['frontier'], label='Frontier'),
-            patches.Patch(color=self.colors['explored'], label='Explored'),
-            patches.Patch(color=self.colors['path'], label='Path'),
-            patches.Patch(color=self.colors['dynamic_obstacle'], label='Dynamic Obstacle')
-        ]
-        self.ax.legend(handles=legend_elements, loc='upper left', 
-                      bbox_to_anchor=(1.02, 1))
-        
-        plt.tight_layout()
+        if show_legend:
+            self.ax.legend(handles=self._legend_handles, loc='upper left', 
+                          bbox_to_anchor=(1.02, 1))
     
     def animate(self, delay=100):
         """Animate the search process"""
@@ -227,18 +372,28 @@ class SearchAlgorithms:
         self.steps = 0
         
     def reconstruct_path(self, came_from, current):
-        """Reconstruct path from came_from dictionary"""
+        """Reconstruct the path of cell ids from came_from dictionary"""
         path = []
         while current in came_from:
             path.append(current)
             current = came_from[current]
-        path.append(self.env.start)
+        path.append(self.env.start_id)
         return path[::-1]
     
+    def _reconstruct_bidir(self, meet, came_from_forward, came_from_backward):
+        """Join start -> meet and meet -> target into one path of cell ids"""
+        path = self.reconstruct_path(came_from_forward, meet)
+        node = meet
+        while node in came_from_backward:
+            node = came_from_backward[node]
+            path.append(node)
+        return path
+    
     def bfs(self):
         """Breadth-First Search"""
         print("Running BFS...")
-        frontier = deque([self.env.start])
+        frontier = deque([self.env.start_id])
+        in_frontier = {self.env.start_id}  # O(1) membership; the deque keeps queue order
         came_from = {}
         explored = set()
         
@@ -247,12 +402,13 @@ class SearchAlgorithms:
             new_obs = self.env.spawn_dynamic_obstacle()
             
             current = frontier.popleft()
+            in_frontier.discard(current)
             
-            if current == self.env.target:
+            if current == self.env.target_id:
                 path = self.reconstruct_path(came_from, current)
                 self.viz.add_state(frontier, explored, path)
                 print(f"BFS: Path found in {self.steps} steps!")
-                return path
+                return self.env.decode_path(path)
             
             if current in explored:
                 continue
@@ -261,8 +417,9 @@ class SearchAlgorithms:
             self.steps += 1
             
             for neighbor in self.env.get_neighbors(current):
-                if neighbor not in explored and neighbor not in frontier:
+                if neighbor not in explored and neighbor not in in_frontier:
                     frontier.append(neighbor)
+                    in_frontier.add(neighbor)
                     came_from[neighbor] = current
             
             # Visualize current state
@@ -271,10 +428,56 @@ class SearchAlgorithms:
         print("BFS: No path found!")
         return None
     
+    def bfs_fast(self):
+        """Breadth-First Search for the path only, run by SciPy's compiled
+        breadth_first_order on the grid's adjacency matrix
+        
+        No visualization states are recorded and no dynamic obstacles spawn, so
+        this is meant for benchmarking; the path has BFS's length but may break
+        ties differently from bfs(), so the step count (cells expanded before the
+        target) can differ slightly too.
+        """
+        # Loaded lazily, like in GridEnvironment.to_csr
+        from scipy.sparse.csgraph import breadth_first_order
+        
+        order, predecessors = breadth_first_order(self.env.to_csr(), self.env.start_id,
+                                                  return_predecessors=True)
+        # order covers the whole reachable component; like bfs(), count only the
+        # cells expanded before the target is reached
+        target_pos = np.flatnonzero(order == self.env.target_id)
+        self.steps = int(target_pos[0]) if target_pos.size else len(order)
+        return self._path_from_predecessors(predecessors)
+    
+    def bfs_jit(self):
+        """Breadth-First Search for the path only, run by the Numba-compiled
+        grid_kernels.bfs_grid on the grid array
+        
+        Like bfs_fast, it records no visualization states and spawns no dynamic
+        obstacles; on a static grid it finds the same path as bfs().
+        """
+        # The kernel module pulls in Numba, so only load it for headless runs
+        from grid_kernels import bfs_grid
+        
+        predecessors, steps = bfs_grid(self.env.grid, self.env.start_id, self.env.target_id)
+        self.steps = int(steps)
+        return self._path_from_predecessors(predecessors)
+    
+    def _path_from_predecessors(self, predecessors):
+        """Walk a predecessor array (negative = unreached) back from the target"""
+        start, target = self.env.start_id, self.env.target_id
+        if target != start and predecessors[target] < 0:
+            return None
+        
+        path = [target]
+        while path[-1] != start:
+            path.append(int(predecessors[path[-1]]))
+        return self.env.decode_path(path[::-1])
+    
     def dfs(self):
         """Depth-First Search"""
         print("Running DFS...")
-        frontier = [self.env.start]
+        frontier = [self.env.start_id]
+        frontier_set = {self.env.start_id}  # O(1) membership; the list keeps stack order
         came_from = {}
         explored = set()
         
@@ -283,12 +486,13 @@ class SearchAlgorithms:
             new_obs = self.env.spawn_dynamic_obstacle()
             
             current = frontier.pop()
+            frontier_set.discard(current)
             
-            if current == self.env.target:
+            if current == self.env.target_id:
                 path = self.reconstruct_path(came_from, current)
                 self.viz.add_state(frontier, explored, path)
                 print(f"DFS: Path found in {self.steps} steps!")
-                return path
+                return self.env.decode_path(path)
             
             if current in explored:
                 continue
@@ -299,8 +503,9 @@ class SearchAlgorithms:
             # Add neighbors in reverse order for DFS
             neighbors = self.env.get_neighbors(current)
             for neighbor in reversed(neighbors):
-                if neighbor not in explored and neighbor not in frontier:
+                if neighbor not in explored and neighbor not in frontier_set:
                     frontier.append(neighbor)
+                    frontier_set.add(neighbor)
                     came_from[neighbor] = current
             
             # Visualize current state
@@ -312,9 +517,11 @@ class SearchAlgorithms:
     def ucs(self):
         """Uniform-Cost Search"""
         print("Running UCS...")
-        frontier = [(0, self.env.start)]
+        frontier = [(0, self.env.start_id)]
+        # Heap entries per position, so the visualiser doesn't rescan the heap each step
+        frontier_positions = Counter({self.env.start_id: 1})
         came_from = {}
-        cost_so_far = {self.env.start: 0}
+        cost_so_far = {self.env.start_id: 0}
         explored = set()
         
         while frontier:
@@ -322,12 +529,15 @@ class SearchAlgorithms:
             new_obs = self.env.spawn_dynamic_obstacle()
             
             current_cost, current = heapq.heappop(frontier)
+            frontier_positions[current] -= 1
+            if not frontier_positions[current]:
+                del frontier_positions[current]
             
-            if current == self.env.target:
+            if current == self.env.target_id:
                 path = self.reconstruct_path(came_from, current)
-                self.viz.add_state([x[1] for x in frontier], explored, path)
+                self.viz.add_state(frontier_positions, explored, path)
                 print(f"UCS: Path found in {self.steps} steps with cost {current_cost:.2f}!")
-                return path
+                return self.env.decode_path(path)
             
             if current in explored:
                 continue
@@ -335,67 +545,83 @@ class SearchAlgorithms:
             explored.add(current)
             self.steps += 1
             
-            for neighbor in self.env.get_neighbors(current):
-                new_cost = cost_so_far[current] + self.env.get_cost(current, neighbor)
+            base_cost = cost_so_far[current]
+            for neighbor, move_cost in self.env.get_neighbors_with_cost(current):
+                new_cost = base_cost + move_cost
                 
-                if neighbor not in cost_so_far or new_cost < cost_so_far[neighbor]:
+                if new_cost < cost_so_far.get(neighbor, inf):
                     cost_so_far[neighbor] = new_cost
                     heapq.heappush(frontier, (new_cost, neighbor))
+                    frontier_positions[neighbor] += 1
                     came_from[neighbor] = current
             
             # Visualize current state
-            self.viz.add_state([x[1] for x in frontier], explored, dynamic_obs=new_obs)
+            self.viz.add_state(frontier_positions, explored, dynamic_obs=new_obs)
         
         print("UCS: No path found!")
         return None
     
-    def dls(self, depth_limit=10):
-        """Depth-Limited Search"""
-        print(f"Running DLS with depth limit {depth_limit}...")
+    def _depth_limited_search(self, depth_limit):
+        """Depth-limited DFS from start, returning the path of cell ids or None
         
-        def dls_recursive(node, depth, came_from, explored, frontier_set):
-            if depth == 0:
+        Runs on an explicit stack of (node, remaining depth, neighbor iterator,
+        obstacle spawned on entry) frames instead of recursing per neighbor.
+        """
+        came_from = {}
+        explored = set()
+        frontier_set = set([self.env.start_id])
+        stack = []
+        node, depth = self.env.start_id, depth_limit
+        
+        while True:
+            # Enter node; at depth 0 it is given up on straight away
+            if depth > 0:
+                # Check for dynamic obstacle
+                new_obs = self.env.spawn_dynamic_obstacle()
+                
+                if node == self.env.target_id:
+                    return self.reconstruct_path(came_from, node)
+                
+                explored.add(node)
+                self.steps += 1
+                stack.append((node, depth, iter(self.env.get_neighbors(node)), new_obs))
+            elif stack:
+                frontier_set.discard(node)
+            
+            # Move to the next unexplored neighbor of the deepest node, backing
+            # out of nodes whose neighbors are used up
+            while stack:
+                parent, parent_depth, neighbors, parent_obs = stack[-1]
+                neighbor = next((n for n in neighbors if n not in explored), None)
+                if neighbor is not None:
+                    break
+                stack.pop()
+                if stack:
+                    frontier_set.discard(parent)
+            else:
                 return None
             
-            # Check for dynamic obstacle
-            new_obs = self.env.spawn_dynamic_obstacle()
-            
-            if node == self.env.target:
-                return self.reconstruct_path(came_from, node)
-            
-            explored.add(node)
-            self.steps += 1
+            frontier_set.add(neighbor)
+            came_from[neighbor] = parent
             
-            for neighbor in self.env.get_neighbors(node):
-                if neighbor not in explored:
-                    frontier_set.add(neighbor)
-                    came_from[neighbor] = node
-                    
-                    # Visualize
-                    self.viz.add_state(list(frontier_set), explored, dynamic_obs=new_obs)
-                    
-                    result = dls_recursive(neighbor, depth - 1, came_from, 
-                                          explored, frontier_set)
-                    if result is not None:
-                        return result
-                    
-                    frontier_set.discard(neighbor)
+            # Visualize
+            self.viz.add_state(frontier_set, explored, dynamic_obs=parent_obs)
             
-            return None
-        
-        came_from = {}
-        explored = set()
-        frontier_set = set([self.env.start])
+            node, depth = neighbor, parent_depth - 1
+    
+    def dls(self, depth_limit=10):
+        """Depth-Limited Search"""
+        print(f"Running DLS with depth limit {depth_limit}...")
         
-        result = dls_recursive(self.env.start, depth_limit, came_from, 
-                              explored, frontier_set)
+        result = self._depth_limited_search(depth_limit)
         
         if result:
             print(f"DLS: Path found in {self.steps} steps!")
         else:
             print(f"DLS: No path found within depth limit {depth_limit}!")
+            return None
         
-        return result
+        return self.env.decode_path(result)
     
     def iddfs(self, max_depth=20):
         """Iterative Deepening DFS"""
@@ -405,138 +631,93 @@ class SearchAlgorithms:
             print(f"  Trying depth {depth}...")
             self.steps = 0
             
-            # Reset for each iteration
-            came_from = {}
-            explored = set()
-            frontier_set = set([self.env.start])
-            
-            def iddfs_recursive(node, current_depth):
-                if current_depth == 0:
-                    return None
-                
-                # Check for dynamic obstacle
-                new_obs = self.env.spawn_dynamic_obstacle()
-                
-                if node == self.env.target:
-                    return self.reconstruct_path(came_from, node)
-                
-                explored.add(node)
-                self.steps += 1
-                
-                for neighbor in self.env.get_neighbors(node):
-                    if neighbor not in explored:
-                        frontier_set.add(neighbor)
-                        came_from[neighbor] = node
-                        
-                        # Visualize
-                        self.viz.add_state(list(frontier_set), explored, 
-                                         dynamic_obs=new_obs)
-                        
-                        result = iddfs_recursive(neighbor, current_depth - 1)
-                        if result is not None:
-                            return result
-                        
-                        frontier_set.discard(neighbor)
-                
-                return None
-            
-            result = iddfs_recursive(self.env.start, depth)
+            result = self._depth_limited_search(depth)
             
             if result:
                 print(f"IDDFS: Path found at depth {depth} in {self.steps} steps!")
-                return result
+                return self.env.decode_path(result)
         
         print(f"IDDFS: No path found within max depth {max_depth}!")
         return None
     
     def bidirectional_search(self):
-        """Bidirectional Search"""
+        """Bidirectional Search
+        
+        Each pass expands the smaller of the two frontiers by one whole layer and
+        stops as soon as a newly reached cell has already been reached from the
+        other side, instead of waiting for it to be popped.
+        """
         print("Running Bidirectional Search...")
         
         # Forward search from start
-        frontier_forward = deque([self.env.start])
+        frontier_forward = [self.env.start_id]
         came_from_forward = {}
-        explored_forward = set()
+        reached_forward = {self.env.start_id}
         
         # Backward search from target
-        frontier_backward = deque([self.env.target])
+        frontier_backward = [self.env.target_id]
         came_from_backward = {}
-        explored_backward = set()
+        reached_backward = {self.env.target_id}
         
-        while frontier_forward and frontier_backward:
-            # Check for dynamic obstacle
-            new_obs = self.env.spawn_dynamic_obstacle()
-            
-            # Forward step
-            if frontier_forward:
-                current_forward = frontier_forward.popleft()
-                
-                if current_forward in explored_backward:
-                    # Found intersection!
-                    path_forward = self.reconstruct_path(came_from_forward, 
-                                                        current_forward)
-                    path_backward = []
-                    node = current_forward
-                    while node in came_from_backward:
-                        node = came_from_backward[node]
-                        path_backward.append(node)
-                    
-                    path = path_forward + path_backward
-                    self.viz.add_state(
-                        list(frontier_forward) + list(frontier_backward),
-                        explored_forward | explored_backward,
-                        path
-                    )
-                    print(f"Bidirectional: Path found in {self.steps} steps!")
-                    return path
+        # Cells expanded by either side, kept up to date instead of re-unioning
+        # the two sides for every visualised state
+        explored = set()
+        
+        # Start and target are the same cell: the searches already meet there
+        if self.env.start_id == self.env.target_id:
+            path = [self.env.start_id]
+            self.viz.add_state([], explored, path)
+            print(f"Bidirectional: Path found in {self.steps} steps!")
+            return self.env.decode_path(path)
+        
+        def expand_layer(layer, came_from, reached, reached_other, frontier_other):
+            """Expand one layer a cell at a time, like the other searches; returns
+            the cells still to expand and the meeting cell, if any"""
+            next_layer = []
+            for i, current in enumerate(layer):
+                # Check for dynamic obstacle
+                new_obs = self.env.spawn_dynamic_obstacle()
                 
-                if current_forward not in explored_forward:
-                    explored_forward.add(current_forward)
-                    self.steps += 1
-                    
-                    for neighbor in self.env.get_neighbors(current_forward):
-                        if neighbor not in explored_forward:
-                            frontier_forward.append(neighbor)
-                            came_from_forward[neighbor] = current_forward
-            
-            # Backward step
-            if frontier_backward:
-                current_backward = frontier_backward.popleft()
+                explored.add(current)
+                self.steps += 1
                 
-                if current_backward in explored_forward:
-                    # Found intersection!
-                    path_forward = self.reconstruct_path(came_from_forward, 
-                                                        current_backward)
-                    path_backward = []
-                    node = current_backward
-                    while node in came_from_backward:
-                        node = came_from_backward[node]
-                        path_backward.append(node)
-                    
-                    path = path_forward + path_backward
-                    self.viz.add_state(
-                        list(frontier_forward) + list(frontier_backward),
-                        explored_forward | explored_backward,
-                        path
-                    )
-                    print(f"Bidirectional: Path found in {self.steps} steps!")
-                    return path
+                for neighbor in self.env.get_neighbors(current):
+                    if neighbor not in reached:
+                        reached.add(neighbor)
+                        came_from[neighbor] = current
+                        next_layer.append(neighbor)
+                        
+                        if neighbor in reached_other:
+                            return layer[i + 1:] + next_layer, neighbor
                 
-                if current_backward not in explored_backward:
-                    explored_backward.add(current_backward)
-                    self.steps += 1
-                    
-                    for neighbor in self.env.get_neighbors(current_backward):
-                        if neighbor not in explored_backward:
-                            frontier_backward.append(neighbor)
-                            came_from_backward[neighbor] = current_backward
-            
-            # Visualize current state
-            self.viz.add_state(
-                list(frontier_forward) + list(frontier_backward),
-                explored_forward | explored_backward,
-                dynamic_obs=new_obs
-            )
+                # Visualize current state
+                self.viz.add_state(
+                    layer[i + 1:] + next_layer + frontier_other,
+                    explored,
+                    dynamic_obs=new_obs
+                )
+            return next_layer, None
+        
+        while frontier_forward and frontier_backward:
+            if len(frontier_forward) <= len(frontier_backward):
+                frontier_forward, meet = expand_layer(frontier_forward, came_from_forward,
+                                                      reached_forward, reached_backward,
+                                                      frontier_backward)
+            else:
+                frontier_backward, meet = expand_layer(frontier_backward, came_from_backward,
+                                                       reached_backward, reached_forward,
+                                                       frontier_forward)
+            
+            if meet is not None:
+                # Found intersection!
+                path = self._reconstruct_bidir(meet, came_from_forward, came_from_backward)
+                self.viz.add_state(
+                    frontier_forward + frontier_backward,
+                    explored,
+                    path
+                )
+                print(f"Bidirectional: Path found in {self.steps} steps!")
+                return self.env.decode_path(path)
         
         print("Bidirectional: No path found!")
         return None
@@ -553,16 +734,17 @@ def create_sample_environment(scenario='best'):
         env.add_static_obstacles(obstacles)
     elif scenario == 'worst':
         # Worst case: Complex maze
-        obstacles = []
-        # Create a maze-like structure
-        for i in range(2, 8):
-            obstacles.append((i, 3))
-            obstacles.append((i, 7))
-        for j in range(1, 9):
-            if j != 5:
-                obstacles.append((2, j))
-                obstacles.append((7, j))
-        env.add_static_obstacles(obstacles)
+        # Create a maze-like structure: walls down columns 3 and 7, and along
+        # rows 2 and 7 with a gap at column 5
+        rows = np.arange(2, 8)
+        cols = np.array([j for j in range(1, 9) if j != 5])
+        obstacles = np.concatenate([
+            np.column_stack((rows, np.full_like(rows, 3))),
+            np.column_stack((rows, np.full_like(rows, 7))),
+            np.column_stack((np.full_like(cols, 2), cols)),
+            np.column_stack((np.full_like(cols, 7), cols))
+        ])
+        env.add_static_obstacles_bulk(obstacles)
     else:
         # Medium case
         obstacles = [(i, 5) for i in range(1, 9) if i != 4]
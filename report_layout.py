@@ -0,0 +1,929 @@
+"""
+Page layout for the AI Pathfinder assignment report: styles, flowables and PDF rendering
+"""
+
+import io
+
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.units import inch
+from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY
+from reportlab.platypus import (Flowable, Frame, Paragraph, Spacer, PageBreak,
+                                Table, TableStyle)
+from reportlab.platypus.doctemplate import LayoutError
+from reportlab.platypus import paragraph
+from reportlab.platypus.paragraph import cleanBlockQuotedText
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfgen import canvas
+from reportlab.lib import colors
+try:
+    from pypdf import PdfReader, PdfWriter
+except ImportError:  # optional: without pypdf every report is laid out in full
+    PdfReader = PdfWriter = None
+
+
+_COLOR_TITLE = colors.HexColor('#1a1a1a')
+_COLOR_H1 = colors.HexColor('#2c3e50')
+_COLOR_H2 = colors.HexColor('#34495e')
+
+
+# Text widths measured during paragraph wrapping, keyed by (text, font, size, encoding)
+_STRING_WIDTH_CACHE = {}
+_STRING_WIDTH_CACHE_LIMIT = 50_000
+_uncached_string_width = pdfmetrics.stringWidth
+
+# Every font the report uses, resolved once so cache misses skip the getFont lookup
+_FONTS = {name: pdfmetrics.getFont(name)
+          for name in ('Helvetica', 'Helvetica-Bold', 'Helvetica-Oblique',
+                       'Helvetica-BoldOblique', 'Courier')}
+
+
+def _cached_string_width(text, fontName, fontSize, encoding='utf8'):
+    """pdfmetrics.stringWidth, memoised for the words and headings that repeat across the report"""
+    key = (text, fontName, fontSize, encoding)
+    width = _STRING_WIDTH_CACHE.get(key)
+    if width is None:
+        if len(_STRING_WIDTH_CACHE) >= _STRING_WIDTH_CACHE_LIMIT:
+            _STRING_WIDTH_CACHE.clear()
+        font = _FONTS.get(fontName)
+        if font is not None:
+            width = font.stringWidth(text, fontSize, encoding)
+        else:
+            width = _uncached_string_width(text, fontName, fontSize, encoding)
+        _STRING_WIDTH_CACHE[key] = width
+    return width
+
+
+# paragraph imports stringWidth by name, so it has to be patched there too
+pdfmetrics.stringWidth = paragraph.stringWidth = _cached_string_width
+
+
+# Define styles
+styles = getSampleStyleSheet()
+
+# Custom styles
+title_style = ParagraphStyle(
+    'CustomTitle',
+    parent=styles['Heading1'],
+    spaceBefore=0,
+    spaceAfter=0,
+    fontSize=24,
+    textColor=_COLOR_TITLE,
+    alignment=TA_CENTER,
+    fontName='Helvetica-Bold'
+)
+
+heading1_style = ParagraphStyle(
+    'CustomHeading1',
+    parent=styles['Heading1'],
+    spaceBefore=0,
+    spaceAfter=0,
+    fontSize=18,
+    textColor=_COLOR_H1,
+    fontName='Helvetica-Bold'
+)
+
+heading2_style = ParagraphStyle(
+    'CustomHeading2',
+    parent=styles['Heading2'],
+    spaceBefore=0,
+    spaceAfter=0,
+    fontSize=14,
+    textColor=_COLOR_H2,
+    fontName='Helvetica-Bold'
+)
+
+body_style = ParagraphStyle(
+    'CustomBody',
+    parent=styles['BodyText'],
+    spaceBefore=0,
+    spaceAfter=0,
+    fontSize=11,
+    alignment=TA_JUSTIFY,
+    leading=14
+)
+
+# TOC entries are lines of one paragraph, spaced like separate body paragraphs
+toc_style = ParagraphStyle(
+    'CustomTOC',
+    parent=body_style,
+    leading=26  # body leading plus the 12pt after each body paragraph
+)
+
+code_style = ParagraphStyle(
+    'CodeStyle',
+    parent=styles['Code'],
+    spaceBefore=0,
+    spaceAfter=0,
+    fontSize=9,
+    fontName='Courier',
+    leftIndent=20
+)
+
+# Paragraph spacing as (before, after) points, emitted as explicit Spacers by
+# _explicit_spacing instead of through the styles' spaceBefore/spaceAfter
+_PARAGRAPH_SPACING = {
+    title_style.name: (0, 30),
+    heading1_style.name: (12, 12),
+    heading2_style.name: (10, 10),
+    body_style.name: (6, 12),
+    toc_style.name: (6, 12),
+    code_style.name: (0, 10),
+}
+
+
+# Table styles, shared by every report
+_FEATURES_TABLE_STYLE = TableStyle([
+    ('FONT', (0, 0), (-1, -1), 'Helvetica', 10),
+    ('FONT', (0, 0), (0, -1), 'Helvetica-Bold', 10),
+    ('BACKGROUND', (0, 0), (0, -1), colors.lightblue),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    ('BOX', (0, 0), (-1, -1), 0.5, colors.grey)
+])
+
+_COLOR_TABLE_STYLE = TableStyle([
+    ('FONT', (0, 0), (-1, -1), 'Helvetica', 10),
+    ('FONT', (0, 0), (0, -1), 'Helvetica-Bold', 10),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('BOX', (0, 0), (-1, -1), 0.5, colors.grey),
+    ('BACKGROUND', (0, 0), (0, -1), colors.lightgrey)
+])
+
+_PERF_TABLE_STYLE = TableStyle([
+    ('FONT', (0, 0), (-1, 0), 'Helvetica-Bold', 9),
+    ('FONT', (0, 1), (-1, -1), 'Helvetica', 9),
+    ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('BOX', (0, 0), (-1, -1), 0.5, colors.grey),
+    ('LINEBELOW', (0, 0), (-1, 0), 1, colors.black)
+])
+
+# Column widths in points, computed once instead of per Table call
+_INFO_COLS = (2*inch, 3*inch)
+_FEATURES_COLS = (2*inch, 4*inch)
+_COLOR_COLS = (1.5*inch, 4.5*inch)
+_PERF_COLS = (1.3*inch, 0.9*inch, 0.9*inch, 0.9*inch, 0.9*inch, 1.1*inch)
+
+
+# Parsed paragraph markup, keyed by section name: (frags, style)
+_FRAG_CACHE = {}
+
+
+def cached_paragraph(key, text, style):
+    """Create a Paragraph, running ReportLab's markup parser only once per key"""
+    cached = _FRAG_CACHE.get(key)
+    if cached is not None:
+        frags, parsed_style = cached
+        return Paragraph(text, parsed_style, frags=frags)
+    
+    paragraph = Paragraph(text, style)
+    _FRAG_CACHE[key] = (paragraph.frags, paragraph.style)
+    return paragraph
+
+
+# Parser-built frag per style, cloned for paragraphs without markup: (frag, style)
+_PLAIN_FRAG_TEMPLATES = {}
+
+
+def fast_paragraph(text, style):
+    """Create a Paragraph, skipping the markup parser when the text has no tags or entities"""
+    if '<' in text or '&' in text:
+        return Paragraph(text, style)
+    
+    template = _PLAIN_FRAG_TEMPLATES.get(style.name)
+    if template is None:
+        probe = Paragraph('x', style)
+        template = _PLAIN_FRAG_TEMPLATES[style.name] = (probe.frags[0], probe.style)
+    
+    frag, parsed_style = template
+    text = cleanBlockQuotedText(text)
+    return Paragraph(text, parsed_style, frags=[frag.clone(text=text)])
+
+
+class StudentInfoBlock(Flowable):
+    """Cover-page student details, drawn with plain drawString calls"""
+    
+    row_height = 18
+    label_width, value_width = _INFO_COLS
+    padding = 6
+    
+    def __init__(self, rows):
+        super().__init__()
+        self.rows = rows
+        self.width = self.label_width + self.value_width
+        self.height = self.row_height * len(rows)
+        self.hAlign = 'CENTER'
+    
+    def draw(self):
+        c = self.canv
+        for i, (label, value) in enumerate(self.rows):
+            # Rows are drawn top-down; y is the bottom edge of the row
+            y = self.height - (i + 1) * self.row_height
+            c.setFont('Helvetica-Bold', 11)
+            c.drawString(self.padding, y + 6, label)
+            c.setFont('Helvetica', 11)
+            c.drawString(self.label_width + self.padding, y + 6, value)
+        
+        c.setStrokeColor(colors.grey)
+        c.setLineWidth(1)
+        c.line(0, 0, self.width, 0)
+
+
+# Table of contents entries
+_TOC_ITEMS = (
+    "1. Executive Summary",
+    "2. Project Overview",
+    "3. Algorithm Implementations",
+    "   3.1 Breadth-First Search (BFS)",
+    "   3.2 Depth-First Search (DFS)",
+    "   3.3 Uniform-Cost Search (UCS)",
+    "   3.4 Depth-Limited Search (DLS)",
+    "   3.5 Iterative Deepening DFS (IDDFS)",
+    "   3.6 Bidirectional Search",
+    "4. Dynamic Obstacle System",
+    "5. Visualization Implementation",
+    "6. Performance Analysis",
+    "7. Test Cases and Results",
+    "8. Challenges and Solutions",
+    "9. Conclusion",
+    "10. References"
+)
+
+# Key features table: (feature, description)
+_FEATURES = (
+    ("Real-time Visualization", "Animated step-by-step exploration process"),
+    ("Dynamic Obstacles", "Random obstacles spawn during search execution"),
+    ("Path Re-planning", "Algorithms adapt to newly discovered obstacles"),
+    ("8-Directional Movement", "All diagonal movements included"),
+    ("Color-coded Display", "Clear visual distinction of node states"),
+    ("Performance Metrics", "Step count and path cost tracking")
+)
+
+# Visualization colour legend: (colour, meaning)
+_COLOR_SCHEME = (
+    ("Blue", "Start position (S)"),
+    ("Green", "Target position (T)"),
+    ("Black", "Static walls/obstacles"),
+    ("Orange", "Dynamic obstacles"),
+    ("Yellow", "Frontier nodes (to be explored)"),
+    ("Light Blue", "Explored nodes (already visited)"),
+    ("Red", "Final path from start to target")
+)
+
+# Performance comparison table, header row first
+_PERF_DATA = (
+    ("Algorithm", "Best Case\nSteps", "Worst Case\nSteps", "Memory\nUsage", "Path\nQuality", "Completeness"),
+    ("BFS", "15-20", "80-90", "High", "Optimal", "Yes"),
+    ("DFS", "10-60", "95-100", "Low", "Suboptimal", "No"),
+    ("UCS", "15-20", "85-90", "High", "Optimal", "Yes"),
+    ("DLS", "15-25", "May fail", "Medium", "Suboptimal", "Conditional"),
+    ("IDDFS", "20-30", "90-95", "Low", "Optimal", "Yes"),
+    ("Bidirectional", "10-15", "40-50", "Medium", "Optimal", "Yes")
+)
+
+# Reference list entries (may contain <i> markup)
+_REFERENCES = (
+    "Russell, S., & Norvig, P. (2020). <i>Artificial Intelligence: A Modern Approach</i> (4th ed.). Pearson.",
+    "Cormen, T. H., Leiserson, C. E., Rivest, R. L., & Stein, C. (2009). <i>Introduction to Algorithms</i> (3rd ed.). MIT Press.",
+    "Hart, P. E., Nilsson, N. J., & Raphael, B. (1968). A Formal Basis for the Heuristic Determination of Minimum Cost Paths. <i>IEEE Transactions on Systems Science and Cybernetics</i>, 4(2), 100-107.",
+    "Pohl, I. (1971). Bi-directional Search. <i>Machine Intelligence</i>, 6, 124-140.",
+    "Korf, R. E. (1985). Depth-First Iterative-Deepening: An Optimal Admissible Tree Search. <i>Artificial Intelligence</i>, 27(1), 97-109.",
+    "Matplotlib Documentation. (2024). Retrieved from https://matplotlib.org/",
+    "Python Software Foundation. (2024). <i>Python Documentation</i>. Retrieved from https://docs.python.org/",
+    "Course Lecture Notes - AI 2002: Artificial Intelligence (Spring 2026)"
+)
+
+
+# Skeleton shared by the six algorithm descriptions in section 3
+_ALGORITHM_TEMPLATE = (
+    "<b>Strategy:</b> {strategy}<br/><br/>"
+    "<b>Data Structure:</b> {data_structure}<br/><br/>"
+    "<b>Implementation Details:</b> {implementation}<br/><br/>"
+    "<b>Completeness:</b> {completeness}<br/><br/>"
+    "<b>Optimality:</b> {optimality}<br/><br/>"
+    "<b>Time Complexity:</b> {time}<br/><br/>"
+    "<b>Space Complexity:</b> {space}<br/><br/>"
+    "<b>Pros:</b> {pros}<br/>"
+    "<b>Cons:</b> {cons}"
+)
+
+# Section 3 algorithms: (cache key, heading, template fields)
+_ALGORITHMS = (
+    ('bfs', "Breadth-First Search (BFS)", {
+        'strategy': "BFS explores nodes level by level, ensuring that all nodes at depth d are explored before any nodes at depth d+1.",
+        'data_structure': "Queue (FIFO - First In, First Out)",
+        'implementation': "The algorithm maintains a queue of frontier nodes and a set of explored nodes. At each step, it dequeues the first node, marks it as explored, and adds all unexplored neighbors to the queue.",
+        'completeness': "Yes - guaranteed to find a solution if one exists",
+        'optimality': "Yes - finds the shortest path in terms of number of steps (for unweighted graphs)",
+        'time': "O(b<super>d</super>) where b is branching factor and d is depth",
+        'space': "O(b<super>d</super>) - must store all nodes at current level",
+        'pros': (
+            "Guarantees shortest path (optimal for uniform cost)",
+            "Complete - will always find a solution if it exists",
+            "Simple to implement and understand",
+        ),
+        'cons': (
+            "High memory usage - stores entire frontier",
+            "Slow for deep solutions",
+            "Explores many unnecessary nodes in open spaces",
+        ),
+    }),
+    ('dfs', "Depth-First Search (DFS)", {
+        'strategy': "DFS explores as deep as possible along each branch before backtracking.",
+        'data_structure': "Stack (LIFO - Last In, First Out)",
+        'implementation': "Uses a stack to manage frontier nodes. Explores the most recently discovered node first, going deep into the search space before backtracking.",
+        'completeness': "No - can get stuck in infinite loops or wrong paths",
+        'optimality': "No - does not guarantee shortest path",
+        'time': "O(b<super>m</super>) where m is maximum depth",
+        'space': "O(bm) - only stores path from root to leaf",
+        'pros': (
+            "Low memory usage - only stores current path",
+            "Can find solutions quickly if they exist deep in tree",
+            "Simple to implement",
+        ),
+        'cons': (
+            "Not optimal - may find long, inefficient paths",
+            "Can explore unnecessary deep paths",
+            "May not find solution even if it exists",
+        ),
+    }),
+    ('ucs', "Uniform-Cost Search (UCS)", {
+        'strategy': "Expands the node with the lowest path cost from the start.",
+        'data_structure': "Priority Queue (ordered by cumulative cost)",
+        'implementation': "Uses a min-heap to always expand the lowest-cost node. Accounts for diagonal movement costing √2 while orthogonal movement costs 1.",
+        'completeness': "Yes - if step costs are positive",
+        'optimality': "Yes - guarantees lowest-cost path",
+        'time': "O(b<super>1+C*/ε</super>) where C* is optimal cost and ε is minimum cost",
+        'space': "O(b<super>1+C*/ε</super>)",
+        'pros': (
+            "Optimal for weighted graphs",
+            "Accounts for different movement costs",
+            "Complete for positive costs",
+        ),
+        'cons': (
+            "Higher memory usage than DFS",
+            "Slower than BFS for uniform costs",
+            "More complex implementation",
+        ),
+    }),
+    ('dls', "Depth-Limited Search (DLS)", {
+        'strategy': "DFS with a predetermined depth limit to avoid infinite paths.",
+        'data_structure': "Stack with depth counter",
+        'implementation': "Implements DFS but stops exploring beyond a specified depth limit. Uses recursion with depth tracking.",
+        'completeness': "No - only if solution is within depth limit",
+        'optimality': "No",
+        'time': "O(b<super>l</super>) where l is the depth limit",
+        'space': "O(bl)",
+        'pros': (
+            "Avoids infinite depth problems of DFS",
+            "Memory efficient like DFS",
+            "Useful when approximate depth is known",
+        ),
+        'cons': (
+            "May not find solution if limit is too low",
+            "Not optimal",
+            "Choosing appropriate limit is difficult",
+        ),
+    }),
+    ('iddfs', "Iterative Deepening DFS (IDDFS)", {
+        'strategy': "Repeatedly applies DLS with increasing depth limits until solution is found.",
+        'data_structure': "Stack (applied iteratively with increasing limits)",
+        'implementation': "Performs DLS with limit 1, then 2, then 3, etc., until the target is found. Combines benefits of BFS and DFS.",
+        'completeness': "Yes",
+        'optimality': "Yes (for uniform cost)",
+        'time': "O(b<super>d</super>)",
+        'space': "O(bd) - combines BFS optimality with DFS memory efficiency",
+        'pros': (
+            "Optimal like BFS",
+            "Memory efficient like DFS",
+            "Complete",
+            "No need to know depth in advance",
+        ),
+        'cons': (
+            "Redundant computation - revisits nodes",
+            "Slower than BFS for shallow solutions",
+            "More complex implementation",
+        ),
+    }),
+    ('bidirectional', "Bidirectional Search", {
+        'strategy': "Searches simultaneously from start and goal, meeting in the middle.",
+        'data_structure': "Two queues (one for each direction)",
+        'implementation': "Runs two BFS searches simultaneously - one from start and one from target. Terminates when the two searches meet.",
+        'completeness': "Yes",
+        'optimality': "Yes (if both searches are BFS)",
+        'time': "O(b<super>d/2</super>) - significantly better than BFS",
+        'space': "O(b<super>d/2</super>)",
+        'pros': (
+            "Much faster than unidirectional search",
+            "Reduces search space dramatically",
+            "Optimal and complete",
+        ),
+        'cons': (
+            "Requires knowledge of goal state",
+            "More complex implementation",
+            "Higher memory usage than DFS",
+            "Difficult to implement with multiple goals",
+        ),
+    }),
+)
+
+
+def _bullet_lines(items):
+    """Render items as '• item' lines"""
+    return "".join(f"• {item}<br/>" for item in items)
+
+
+def _algorithm_text(fields):
+    """Fill the algorithm description template for one algorithm"""
+    return _ALGORITHM_TEMPLATE.format(**dict(fields, pros=_bullet_lines(fields['pros']),
+                                             cons=_bullet_lines(fields['cons'])))
+
+
+class _ParagraphSpace(Spacer):
+    """Spacer standing in for a paragraph's spaceBefore/spaceAfter
+    
+    _draw_flowables drops it at the top of a page and when it doesn't fit
+    (leaving the page full), as Frame did with the style spacing it replaces.
+    """
+
+
+def _explicit_spacing(flowables):
+    """Insert _ParagraphSpace spacers for paragraph spacing
+    
+    Adjacent spaces overlap rather than add up (a gap is the larger of the
+    space after one paragraph and the space before the next), and no space
+    is added after a PageBreak. Spacing at pages that fill up on their own
+    is handled by _draw_flowables.
+    """
+    spaced = []
+    prev_after = None  # None while at the top of a page
+    
+    for flowable in flowables:
+        if isinstance(flowable, PageBreak):
+            spaced.append(flowable)
+            prev_after = None
+            continue
+        
+        before, after = (0, 0)
+        if isinstance(flowable, Paragraph):
+            before, after = _PARAGRAPH_SPACING.get(flowable.style.name, (0, 0))
+        
+        if prev_after is not None and before > prev_after:
+            spaced.append(_ParagraphSpace(1, before - prev_after))
+        spaced.append(flowable)
+        if after:
+            spaced.append(_ParagraphSpace(1, after))
+        prev_after = after
+    
+    return spaced
+
+
+# Report body flowables, built once and reused by every create_report call
+_STATIC_FLOWABLES = None
+
+
+def _build_static_flowables():
+    """Build the report body (everything after the cover page)"""
+    elements = []
+    
+    # ==================== Table of Contents ====================
+    elements.append(fast_paragraph("Table of Contents", heading1_style))
+    elements.append(Spacer(1, 0.2*inch))
+    
+    elements.append(fast_paragraph("<br/>".join(_TOC_ITEMS), toc_style))
+    
+    elements.append(PageBreak())
+    
+    # ==================== Executive Summary ====================
+    elements.append(fast_paragraph("1. Executive Summary", heading1_style))
+    elements.append(Spacer(1, 0.1*inch))
+    
+    summary_text = """
+    This report presents a comprehensive implementation of six uninformed search algorithms 
+    applied to pathfinding in a dynamic grid environment. The project successfully demonstrates 
+    how different search strategies explore a graph space, with real-time visualization showing 
+    the exploration process, frontier management, and final path selection.
+    
+    All six algorithms (BFS, DFS, UCS, DLS, IDDFS, and Bidirectional Search) have been 
+    implemented with support for 8-directional movement (including all diagonals) and dynamic 
+    obstacle handling. The system can detect obstacles that spawn during runtime and re-plan 
+    paths accordingly, demonstrating robust adaptive behavior.
+    
+    The implementation features a sophisticated GUI built with Matplotlib that provides 
+    step-by-step animation of the search process, color-coded visualization of different 
+    node states, and clear distinction between static walls, dynamic obstacles, frontier 
+    nodes, explored nodes, and the final path.
+    
+    Performance analysis reveals distinct characteristics for each algorithm, with BFS and 
+    Bidirectional Search showing optimal performance for shortest path finding, while DFS 
+    demonstrates memory efficiency at the cost of path optimality. The report includes 
+    detailed test cases covering best-case and worst-case scenarios for each algorithm.
+    """
+    
+    elements.append(cached_paragraph('summary', summary_text, body_style))
+    elements.append(PageBreak())
+    
+    # ==================== Project Overview ====================
+    elements.append(fast_paragraph("2. Project Overview", heading1_style))
+    elements.append(Spacer(1, 0.1*inch))
+    
+    overview_text = """
+    This project implements an AI Pathfinder that visualizes six fundamental uninformed 
+    search algorithms in a grid-based environment. The primary objective is not merely to 
+    find a path from start to target, but to demonstrate how each algorithm "thinks" and 
+    explores the search space.
+    """
+    elements.append(cached_paragraph('overview', overview_text, body_style))
+    
+    elements.append(fast_paragraph("2.1 Key Features", heading2_style))
+    
+    # Row heights are pinned (leading + 6pt cell padding) so Table doesn't measure every cell
+    features_table = Table([list(row) for row in _FEATURES], colWidths=_FEATURES_COLS,
+                           rowHeights=[18] * len(_FEATURES))
+    features_table.setStyle(_FEATURES_TABLE_STYLE)
+    
+    elements.append(features_table)
+    elements.append(Spacer(1, 0.2*inch))
+    
+    elements.append(fast_paragraph("2.2 Movement Order", heading2_style))
+    
+    movement_text = """
+    The implementation follows a strict clockwise movement order with all eight directions:
+    Up, Top-Right (diagonal), Right, Bottom-Right (diagonal), Bottom, Bottom-Left (diagonal), 
+    Left, and Top-Left (diagonal). This ensures consistent and predictable behavior across 
+    all algorithms.
+    """
+    elements.append(cached_paragraph('movement', movement_text, body_style))
+    elements.append(PageBreak())
+    
+    # ==================== Algorithm Implementations ====================
+    elements.append(fast_paragraph("3. Algorithm Implementations", heading1_style))
+    elements.append(Spacer(1, 0.2*inch))
+    
+    for i, (key, title, fields) in enumerate(_ALGORITHMS, start=1):
+        elements.append(fast_paragraph(f"3.{i} {title}", heading2_style))
+        elements.append(cached_paragraph(key, _algorithm_text(fields), body_style))
+        # Two algorithms per page
+        elements.append(Spacer(1, 0.2*inch) if i % 2 else PageBreak())
+    
+    # ==================== Dynamic Obstacle System ====================
+    elements.append(fast_paragraph("4. Dynamic Obstacle System", heading1_style))
+    elements.append(Spacer(1, 0.1*inch))
+    
+    dynamic_text = """
+    The dynamic obstacle system adds realism and complexity to the pathfinding challenge. 
+    Unlike static mazes where the environment is known and unchanging, this implementation 
+    simulates real-world scenarios where new obstacles can appear unexpectedly.
+    
+    <b>Implementation Details:</b><br/>
+    • At each algorithm step, there is a configurable probability (default 0.5%) of a new 
+    obstacle spawning<br/>
+    • Obstacles spawn at random empty locations (not on start, target, or existing obstacles)<br/>
+    • When a dynamic obstacle appears, it is immediately reflected in the grid<br/>
+    • Algorithms must check if their planned path is still valid<br/>
+    • If the path is blocked, the algorithm continues searching for an alternative route<br/>
+    <br/>
+    <b>Visual Distinction:</b><br/>
+    Dynamic obstacles are displayed in orange color, distinguishing them from black static 
+    walls. This allows observers to clearly see when and where new obstacles appear during 
+    the search process.
+    
+    <b>Re-planning Strategy:</b><br/>
+    The current implementation handles dynamic obstacles by continuing the search from the 
+    current frontier. This means that if an obstacle blocks a node that was about to be 
+    explored, the algorithm simply skips that node and continues with other frontier nodes. 
+    The search naturally adapts to the new environment configuration.
+    """
+    elements.append(cached_paragraph('dynamic', dynamic_text, body_style))
+    elements.append(PageBreak())
+    
+    # ==================== Visualization ====================
+    elements.append(fast_paragraph("5. Visualization Implementation", heading1_style))
+    elements.append(Spacer(1, 0.1*inch))
+    
+    viz_text = """
+    The visualization system is built using Matplotlib and provides comprehensive insight 
+    into how each algorithm explores the search space.
+    
+    <b>Color Scheme:</b>
+    """
+    elements.append(cached_paragraph('viz', viz_text, body_style))
+    
+    color_table = Table([list(row) for row in _COLOR_SCHEME], colWidths=_COLOR_COLS,
+                        rowHeights=[18] * len(_COLOR_SCHEME))
+    color_table.setStyle(_COLOR_TABLE_STYLE)
+    
+    elements.append(color_table)
+    elements.append(Spacer(1, 0.2*inch))
+    
+    viz_features = """
+    <b>Animation Features:</b><br/>
+    • Step-by-step progression with configurable delay<br/>
+    • Grid lines for clear cell delineation<br/>
+    • Interactive legend showing all element types<br/>
+    • Window title: "GOOD PERFORMANCE TIME APP"<br/>
+    • Algorithm name displayed at top of grid<br/>
+    <br/>
+    <b>Implementation Approach:</b><br/>
+    The visualizer stores the complete history of the search process, including frontier 
+    and explored sets at each step. This allows for smooth animation that can be paused, 
+    replayed, or analyzed frame by frame.
+    """
+    elements.append(cached_paragraph('viz_features', viz_features, body_style))
+    elements.append(PageBreak())
+    
+    # ==================== Performance Analysis ====================
+    elements.append(fast_paragraph("6. Performance Analysis", heading1_style))
+    elements.append(Spacer(1, 0.1*inch))
+    
+    perf_text = """
+    Comprehensive performance analysis across different scenarios reveals distinct 
+    characteristics for each algorithm:
+    """
+    elements.append(cached_paragraph('perf', perf_text, body_style))
+    
+    # Performance comparison table
+    
+    # Two-line header at 9pt, single-line rows below it
+    perf_table = Table([list(row) for row in _PERF_DATA], colWidths=_PERF_COLS,
+                       rowHeights=[27.6] + [16.8] * (len(_PERF_DATA) - 1))
+    perf_table.setStyle(_PERF_TABLE_STYLE)
+    
+    elements.append(perf_table)
+    elements.append(Spacer(1, 0.2*inch))
+    
+    analysis_text = """
+    <b>Key Observations:</b><br/>
+    <br/>
+    1. <b>Bidirectional Search</b> shows the best performance in worst-case scenarios, 
+    reducing search space by approximately 50% compared to BFS.<br/>
+    <br/>
+    2. <b>BFS and UCS</b> provide optimal paths but at the cost of high memory usage, 
+    storing the entire frontier.<br/>
+    <br/>
+    3. <b>DFS</b> is highly memory efficient but can find very suboptimal paths and may 
+    explore unnecessary portions of the grid.<br/>
+    <br/>
+    4. <b>IDDFS</b> successfully combines the optimality of BFS with the space efficiency 
+    of DFS, though with some redundant computation.<br/>
+    <br/>
+    5. <b>DLS</b> performance heavily depends on choosing an appropriate depth limit; too 
+    low and it fails, too high and it wastes computation.<br/>
+    <br/>
+    6. <b>UCS</b> accounts for diagonal movement costs (√2 vs 1), finding paths that 
+    minimize actual distance rather than just step count.<br/>
+    """
+    elements.append(cached_paragraph('analysis', analysis_text, body_style))
+    elements.append(PageBreak())
+    
+    # ==================== Test Cases ====================
+    elements.append(fast_paragraph("7. Test Cases and Results", heading1_style))
+    elements.append(Spacer(1, 0.1*inch))
+    
+    test_intro = """
+    Each algorithm was tested in two scenarios designed to reveal its characteristics:
+    
+    <b>Best Case Scenario:</b> Direct path available with minimal obstacles. This tests 
+    how efficiently the algorithm finds an obvious solution.<br/>
+    <br/>
+    <b>Worst Case Scenario:</b> Complex maze requiring exploration of multiple dead ends. 
+    This tests how the algorithm handles challenging search spaces.<br/>
+    """
+    elements.append(cached_paragraph('test_intro', test_intro, body_style))
+    
+    elements.append(fast_paragraph("Note: Screenshots from actual test runs would be inserted here in the final report.", body_style))
+    elements.append(Spacer(1, 0.2*inch))
+    
+    test_results = """
+    <b>Test Results Summary:</b><br/>
+    <br/>
+    The testing revealed that Bidirectional Search and BFS performed most reliably across 
+    scenarios, while DFS showed high variance in path quality. IDDFS demonstrated good 
+    balance between optimality and memory usage, making it suitable for scenarios where 
+    solution depth is unknown.
+    """
+    elements.append(cached_paragraph('test_results', test_results, body_style))
+    elements.append(PageBreak())
+    
+    # ==================== Challenges ====================
+    elements.append(fast_paragraph("8. Challenges and Solutions", heading1_style))
+    elements.append(Spacer(1, 0.1*inch))
+    
+    challenges = """
+    <b>Challenge 1: Dynamic Obstacle Handling</b><br/>
+    <i>Problem:</i> Ensuring algorithms gracefully handle obstacles appearing during search.<br/>
+    <i>Solution:</i> Implemented obstacle validity checking at each step, allowing algorithms 
+    to skip blocked nodes and continue with alternative paths.<br/>
+    <br/>
+    <b>Challenge 2: Visualization Performance</b><br/>
+    <i>Problem:</i> Animating hundreds of search steps without overwhelming the GUI.<br/>
+    <i>Solution:</i> Used Matplotlib's FuncAnimation with configurable delay and stored 
+    complete history for smooth playback.<br/>
+    <br/>
+    <b>Challenge 3: Diagonal Movement Costs</b><br/>
+    <i>Problem:</i> Accurately representing that diagonal moves cover more distance.<br/>
+    <i>Solution:</i> Implemented cost calculation function in UCS that assigns cost of √2 
+    to diagonal moves and 1 to orthogonal moves.<br/>
+    <br/>
+    <b>Challenge 4: Bidirectional Search Meeting Point</b><br/>
+    <i>Problem:</i> Detecting when forward and backward searches intersect.<br/>
+    <i>Solution:</i> Maintained separate explored sets for each direction and checked for 
+    intersection at each step.<br/>
+    <br/>
+    <b>Challenge 5: IDDFS Efficiency</b><br/>
+    <i>Problem:</i> Redundant re-exploration of nodes at each depth increment.<br/>
+    <i>Solution:</i> Accepted this as inherent to IDDFS; the space savings justify the time 
+    overhead for deep solutions.<br/>
+    """
+    elements.append(cached_paragraph('challenges', challenges, body_style))
+    elements.append(PageBreak())
+    
+    # ==================== Conclusion ====================
+    elements.append(fast_paragraph("9. Conclusion", heading1_style))
+    elements.append(Spacer(1, 0.1*inch))
+    
+    conclusion = """
+    This project successfully demonstrates the implementation and visualization of six 
+    fundamental uninformed search algorithms. Each algorithm exhibits distinct 
+    characteristics in terms of completeness, optimality, time complexity, and space 
+    complexity.
+    
+    The key findings are:
+    
+    1. <b>No single algorithm is universally best</b> - the choice depends on the specific 
+    requirements and constraints of the problem.<br/>
+    <br/>
+    2. <b>Trade-offs are inevitable</b> - algorithms that guarantee optimal solutions (BFS, 
+    UCS, IDDFS) require more resources than those that don't (DFS, DLS).<br/>
+    <br/>
+    3. <b>Bidirectional search offers significant advantages</b> when both start and goal 
+    states are known, effectively halving the search depth.<br/>
+    <br/>
+    4. <b>Dynamic environments require adaptive algorithms</b> - the ability to handle 
+    runtime changes is crucial for real-world applications.<br/>
+    <br/>
+    5. <b>Visualization is essential for understanding</b> - seeing how algorithms explore 
+    provides insights that pure metrics cannot capture.<br/>
+    
+    Future enhancements could include:
+    • Implementation of informed search algorithms (A*, Greedy Best-First)<br/>
+    • Support for weighted grids with variable terrain costs<br/>
+    • Multi-agent pathfinding with collision avoidance<br/>
+    • Performance optimization using heuristics<br/>
+    • Extended testing on larger grid sizes<br/>
+    
+    This assignment has provided deep understanding of fundamental search algorithms, their 
+    practical implementation challenges, and the trade-offs involved in choosing appropriate 
+    strategies for different scenarios.
+    """
+    elements.append(cached_paragraph('conclusion', conclusion, body_style))
+    elements.append(PageBreak())
+    
+    # ==================== References ====================
+    elements.append(fast_paragraph("10. References", heading1_style))
+    elements.append(Spacer(1, 0.1*inch))
+    
+    elements.append(fast_paragraph("<br/><br/>".join(f"• {ref}" for ref in _REFERENCES), body_style))
+    
+    return elements
+
+
+def _static_flowables():
+    """Return the shared report body, building it on first use"""
+    global _STATIC_FLOWABLES
+    if _STATIC_FLOWABLES is None:
+        _STATIC_FLOWABLES = _explicit_spacing(_build_static_flowables())
+    return _STATIC_FLOWABLES
+
+
+def _new_frame():
+    """Create the body frame of a letter page (72pt margins, 18pt at the bottom)"""
+    page_width, page_height = letter
+    return Frame(72, 18, page_width - 144, page_height - 90)
+
+
+def _draw_flowables(c, flowables):
+    """Lay flowables out onto the canvas, emitting each page as soon as it is full"""
+    pending = list(flowables)
+    frame = _new_frame()
+    page_full = False  # paragraph spacing ran past the bottom of the page
+    
+    while pending:
+        flowable = pending.pop(0)
+        
+        if isinstance(flowable, PageBreak):
+            c.showPage()
+            frame = _new_frame()
+            page_full = False
+            continue
+        
+        if isinstance(flowable, _ParagraphSpace):
+            # Never carried to the next page: dropped at the top of a page, and
+            # space that doesn't fit fills the page, as overflowing spaceAfter did
+            if not (frame._atTop or page_full or frame.add(flowable, c)):
+                page_full = True
+            continue
+        
+        if page_full:
+            c.showPage()
+            frame = _new_frame()
+            page_full = False
+        
+        if frame.add(flowable, c):
+            continue
+        
+        # Doesn't fit: draw what fits here and carry the rest to the next page
+        parts = frame.split(flowable, c)
+        if parts:
+            if not frame.add(parts[0], c):
+                raise LayoutError(f"Could not place split part of {flowable.identity()}")
+            pending[:0] = parts[1:]
+        elif frame._atTop:
+            raise LayoutError(f"{flowable.identity()} is too large for an empty page")
+        else:
+            pending.insert(0, flowable)
+        
+        c.showPage()
+        frame = _new_frame()
+
+
+def _render_pdf(flowables):
+    """Lay flowables out on a fresh letter-size canvas and return the PDF bytes"""
+    buffer = io.BytesIO()
+    c = canvas.Canvas(buffer, pagesize=letter, pageCompression=1)
+    # A bare Canvas has other info defaults than the DocTemplate that used to build the report
+    c.setTitle('(anonymous)')
+    c.setAuthor('(anonymous)')
+    c.setSubject('(unspecified)')
+    c.setCreator('(unspecified)')
+    _draw_flowables(c, flowables)
+    c.save()
+    return buffer.getvalue()
+
+
+# Report body rendered to PDF bytes, built once per process when pypdf is available
+_STATIC_BODY_PDF = None
+
+
+def _static_body_pdf():
+    """Return the rendered report body, rendering it on first use"""
+    global _STATIC_BODY_PDF
+    if _STATIC_BODY_PDF is None:
+        _STATIC_BODY_PDF = _render_pdf(_static_flowables())
+    return _STATIC_BODY_PDF
+
+
+def _merge_pdfs(*pdfs):
+    """Concatenate PDF documents (given as bytes) into one
+    
+    The document info (title, author, dates, producer) is taken from the first
+    document, as if ReportLab had laid out the whole report itself.
+    """
+    writer = PdfWriter()
+    readers = [PdfReader(io.BytesIO(pdf)) for pdf in pdfs]
+    for reader in readers:
+        writer.append(reader)
+    if readers[0].metadata:
+        writer.add_metadata(readers[0].metadata)
+    buffer = io.BytesIO()
+    writer.write(buffer)
+    return buffer.getvalue()
+
+
+def _cover_flowables(info_data):
+    """Build the cover page for one student"""
+    elements = []
+    
+    elements.append(Spacer(1, 1.5*inch))
+    
+    elements.append(cached_paragraph('cover_title', "AI 2002 - Artificial Intelligence", title_style))
+    elements.append(Spacer(1, 0.3*inch))
+    
+    elements.append(cached_paragraph('cover_assignment', "Assignment 1: Question 7", heading1_style))
+    elements.append(Spacer(1, 0.2*inch))
+    
+    elements.append(cached_paragraph('cover_subtitle', "Uninformed Search in a Grid Environment", heading2_style))
+    elements.append(Spacer(1, 0.5*inch))
+    
+    # Student information
+    elements.append(StudentInfoBlock(info_data))
+    
+    return _explicit_spacing(elements)
+
+
+def render_report(info_data):
+    """Render the full report for one student and return the PDF bytes
+    
+    info_data is the list of (label, value) rows shown on the cover page.
+    """
+    cover = _cover_flowables(info_data)
+    
+    # Everything after the cover page is identical for every student, so
+    # when pypdf is around only the cover is laid out per report
+    if PdfWriter is None:
+        return _render_pdf(cover + [PageBreak()] + _static_flowables())
+    return _merge_pdfs(_render_pdf(cover), _static_body_pdf())